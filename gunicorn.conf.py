@@ -0,0 +1,31 @@
+"""
+Gunicorn configuration for the RespiroSync dashboard server.
+
+Usage (from the repository root):
+    gunicorn -c gunicorn.conf.py server.app:app
+
+Render.com injects PORT; WEB_CONCURRENCY and GUNICORN_THREADS may be set in
+the service environment to tune concurrency without editing this file.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# Operator configuration, last-run metrics and the /api/logs buffer live in
+# process memory, so a single worker keeps /api/config, /api/run and
+# /api/metrics consistent.  Concurrency comes from threads instead: /ping,
+# /api/status and /api/logs are served from free threads while /api/run holds
+# one thread waiting on its pipeline subprocess (RUN_WORKERS caps concurrent
+# runs, see server/app.py).
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+
+# A 90 s signal at high fs or a multi-record /api/validate can take well over
+# gunicorn's default 30 s before the first byte is written.
+timeout = 120
+
+# Log to stdout/stderr so Render captures the stream (see server/app.py).
+accesslog = "-"
+errorlog = "-"
@@ -14,7 +14,8 @@ Endpoints
   GET  /api/config        → current operator configuration           [JWT]
   POST /api/config        → update operator configuration            [JWT]
   GET  /api/metrics       → metrics from the last operator run       [JWT]
-  POST /api/run           → run the phase–memory operator            [JWT]
+  POST /api/run           → start the phase–memory operator (async)  [JWT]
+  GET  /api/run/<job_id>  → poll a run started by POST /api/run      [JWT]
 
 Authentication
 --------------
@@ -31,38 +32,41 @@ service dashboard without any extra configuration.
 Scientific basis: PAPER.md §3–4 (phase–memory operator pipeline).
 """
 
+import copy
 import csv
+import hashlib
+import hmac
 import io
 import os
 import smtplib
-import sys
 import logging
+import multiprocessing
 import threading
 import time
-from collections import deque
-from datetime import datetime, timezone, timedelta
-from email import encoders
-from email.mime.base import MIMEBase
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from functools import wraps
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from email.message import EmailMessage, MIMEPart
+from functools import lru_cache, wraps
 from pathlib import Path
 
 import jwt
-from flask import Flask, jsonify, request, send_from_directory, send_file
-
-# ── Import the validation pipeline (validation/ lives at the repo root) ────────
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from validation.pipeline import (  # noqa: E402
+import numpy as np
+import orjson
+from flask import Flask, Response, jsonify, request, send_file
+from flask.json.provider import JSONProvider
+
+# The validation pipeline is importable once the repo is installed
+# (``pip install -e .``) or when running from the repository root.
+from validation.pipeline import (
     run_pipeline,
     DEFAULT_MEMORY_SAMPLES,
     DEFAULT_ALPHA,
     DEFAULT_BASELINE_SAMP,
     DEFAULT_FS,
 )
-from validation.physionet_loader import generate_synthetic_resp  # noqa: E402
-from validation.multi_record_validation import (  # noqa: E402
+from validation.physionet_loader import generate_synthetic_resp
+from validation.multi_record_validation import (
     run_multi_record_validation,
     RESULTS_DIR,
 )
@@ -72,20 +76,32 @@ from validation.multi_record_validation import (  # noqa: E402
 
 LOG_BUFFER_SIZE = 500  # keep the last N log entries in memory for /api/logs
 
-_log_buffer: deque = deque(maxlen=LOG_BUFFER_SIZE)
+# Fixed-size ring buffer: slot (i % LOG_BUFFER_SIZE) holds the i-th record as
+# a (created, levelname, message) tuple.  The list is allocated once; writers
+# overwrite a slot and bump _log_idx under _log_lock, and readers snapshot
+# _log_idx and copy at most n slots.  Timestamps are formatted only when
+# /api/logs is read, and only for the entries it returns.
+_log_ring: list = [None] * LOG_BUFFER_SIZE
+_log_idx = 0  # total records written since startup
+_log_lock = threading.Lock()
 
 
 class _BufferHandler(logging.Handler):
-    """Append formatted log records to the in-memory ring buffer."""
+    """Append log records to the in-memory ring buffer.
+
+    ``emit`` stores the raw creation time, level name and message and does
+    no formatting or encoding; /api/logs does that for the rows it serves.
+    The message itself is interpolated here rather than at read time so the
+    buffer never holds references to the log arguments (exceptions and their
+    tracebacks, mutable dicts) — those could change or pin memory.
+    """
 
     def emit(self, record: logging.LogRecord) -> None:
-        import datetime
-        ts = datetime.datetime.fromtimestamp(record.created).strftime("%Y-%m-%dT%H:%M:%S")
-        _log_buffer.append({
-            "ts": ts,
-            "level": record.levelname,
-            "msg": record.getMessage(),
-        })
+        global _log_idx
+        entry = (record.created, record.levelname, record.getMessage())
+        with _log_lock:
+            _log_ring[_log_idx % LOG_BUFFER_SIZE] = entry
+            _log_idx += 1
 
 
 _fmt = logging.Formatter("%(asctime)s [%(levelname)-8s] %(name)s — %(message)s",
@@ -94,8 +110,7 @@ _fmt = logging.Formatter("%(asctime)s [%(levelname)-8s] %(name)s — %(message)s
 _stream_handler = logging.StreamHandler()  # → stdout → Render log tail
 _stream_handler.setFormatter(_fmt)
 
-_buffer_handler = _BufferHandler()
-_buffer_handler.setFormatter(_fmt)
+_buffer_handler = _BufferHandler()  # no formatter: /api/logs formats on read
 
 logging.basicConfig(level=logging.INFO, handlers=[_stream_handler])
 
@@ -106,42 +121,180 @@ logger.setLevel(logging.INFO)
 # ── Flask application ───────────────────────────────────────────────────────────
 
 app = Flask(__name__, static_folder="static")
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 300  # browser cache for /static/*
+
+# The dashboard is a single static page; read it once at startup so GET /
+# does not stat/open/read the file on every load (restart to pick up edits).
+# Its content hash is the ETag browsers revalidate against.
+_INDEX_HTML: bytes = (Path(app.static_folder) / "index.html").read_bytes()
+_INDEX_ETAG: str = hashlib.sha256(_INDEX_HTML).hexdigest()[:16]
+_INDEX_MAX_AGE_S = 300
 
 _start_time = time.time()
 
+
+class _OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Used by ``jsonify`` for every response and by ``request.get_json`` for
+    request bodies.  NumPy scalars and arrays are encoded natively.
+    """
+
+    _OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=self._OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        # Write orjson's bytes straight into the body (no str round-trip).
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=self._OPTIONS), mimetype="application/json",
+        )
+
+
+app.json = _OrjsonProvider(app)
+
+
 # ── Operator configuration (mutable at runtime via /api/config) ────────────────
+# Copy-on-write snapshot: the dict bound to _config is never mutated.  Readers
+# take one reference (a single atomic global load) and always see a consistent
+# set of parameters; POST /api/config builds a new dict and rebinds _config
+# under _config_lock, so concurrent updates cannot overwrite each other.
+# (A plain dict rather than MappingProxyType, which orjson cannot encode.)
 _config: dict = {
     "memory_samples":   DEFAULT_MEMORY_SAMPLES,  # M  — rolling window (Eq. 4)
     "alpha":            DEFAULT_ALPHA,            # α  — sensitivity     (Eq. 6)
     "baseline_samples": DEFAULT_BASELINE_SAMP,   # calibration window
     "fs":               DEFAULT_FS,              # sample rate (Hz)
 }
+_config_lock = threading.Lock()
+_config_encoded: tuple = (None, b"", "")  # (snapshot, JSON body, ETag), see _encoded_config()
 
 # ── Processing state ────────────────────────────────────────────────────────────
-_run_lock = threading.Lock()
+# Up to RUN_WORKERS operator runs execute concurrently, each in its own
+# pipeline subprocess.  A slot of _run_slots is taken by POST /api/run and
+# released by the background job; only when every slot is busy is a new run
+# rejected with 429.
+_RUN_WORKERS = max(1, int(os.environ.get("RUN_WORKERS", os.cpu_count() or 1)))
+_run_slots = threading.BoundedSemaphore(_RUN_WORKERS)
+_run_executor = ThreadPoolExecutor(
+    max_workers=_RUN_WORKERS, thread_name_prefix="operator-run",
+)
+_pipeline_pool = None  # ProcessPoolExecutor, see _get_pipeline_pool()
+_pipeline_pool_lock = threading.Lock()
+# Jobs remembered for GET /api/run/<job_id>.  Only finished jobs are ever
+# forgotten; the run slots cap unfinished jobs at _RUN_WORKERS, so a table
+# this size always has a finished entry to evict.
+_RUN_JOBS_MAX = max(32, 2 * _RUN_WORKERS)
+_run_jobs: OrderedDict = OrderedDict()  # job_id → Future, least recently used first
+_run_jobs_lock = threading.Lock()
+# Copy-on-write like _config: each run rebinds _last_metrics to its own
+# metrics dict (never mutated afterwards), so concurrent runs cannot leave a
+# reader with an empty or mixed result.
 _last_metrics: dict = {}
+
+# Completed-run cache: (duration_s, M, α, baseline, fs) → (expires_at, metrics).
+# The pipeline is deterministic for a given key, so a repeat POST /api/run
+# within _RUN_CACHE_TTL_S answers immediately.  Cleared on POST /api/config.
+_RUN_CACHE_SIZE = 32
+_RUN_CACHE_TTL_S = 300
+_run_cache: dict = {}
+_run_cache_lock = threading.Lock()
 _validate_lock = threading.Lock()
 
+# Generated reports: (builder name, CSV signatures) → document bytes, least
+# recently used first.  The key changes when the CSVs are rewritten, and
+# api_validate also clears it in case a rewrite leaves the signature unchanged.
+_DOC_CACHE_SIZE = 4
+_doc_cache: OrderedDict = OrderedDict()
+_doc_cache_lock = threading.Lock()
+
+# Parsed results CSVs: filename → (file signature, (header, rows)), see
+# _read_results_csv().  Also cleared by api_validate, since a rewrite within
+# one mtime tick can leave the signature unchanged.
+_csv_cache: dict = {}
+_csv_cache_lock = threading.Lock()
+
+# Encoded email attachments for the current results snapshot (CSV signatures
+# → MIMEPart attachments; also cleared by api_validate), and the SMTP
+# connection reused across /api/send-results.
+_mime_cache: dict = {}
+_mime_cache_lock = threading.Lock()
+_smtp_conn = None  # smtplib.SMTP, see _smtp_send()
+_smtp_lock = threading.Lock()
+
 # ── JWT configuration ────────────────────────────────────────────────────────────
 # JWT_SECRET must be set to a strong random value in production.
 # API_KEY is the shared secret clients exchange for a bearer token.
 _JWT_SECRET: str = os.environ.get("JWT_SECRET", "changeme-jwt-secret")
 _API_KEY: str = os.environ.get("API_KEY", "changeme")
 _USING_DEFAULT_KEY: bool = "API_KEY" not in os.environ
+# Keys are compared as fixed-size digests in constant time (hmac.compare_digest)
+# so response timing does not leak how much of a guessed key was correct.
+_API_KEY_DIGEST: bytes = hashlib.sha256(_API_KEY.encode()).digest()
 _JWT_ALGORITHM = "HS256"
 _JWT_EXPIRY_HOURS = 24
+# Decode settings are fixed, so they are built once rather than per call.
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+_JWT_DECODE_OPTIONS = {"require": ["exp", "iat"]}
+
+# Verified-token cache: SHA-256(token) → time until which the token may be
+# accepted without re-verifying its signature.  Entries live for at most
+# _JWT_CACHE_TTL_S seconds and never beyond the token's own ``exp`` claim.
+_JWT_CACHE_SIZE = 10000
+_JWT_CACHE_TTL_S = 60
+_jwt_cache: dict = {}
+_jwt_cache_lock = threading.Lock()
+
+# /ping is constant for the lifetime of the process, so its body is encoded
+# once.  A fresh Response is still built per request because Werkzeug response
+# objects are mutable and must not be shared between concurrent requests.
+_PING_BODY: bytes = orjson.dumps({"pong": True, "default_key_active": _USING_DEFAULT_KEY})
 
 
 def _make_token() -> str:
     """Return a signed JWT valid for *_JWT_EXPIRY_HOURS* hours."""
+    now = int(time.time())  # NumericDate (RFC 7519 §2) — no datetime objects needed
     payload = {
         "sub": "respirosync",
-        "iat": datetime.now(tz=timezone.utc),
-        "exp": datetime.now(tz=timezone.utc) + timedelta(hours=_JWT_EXPIRY_HOURS),
+        "iat": now,
+        "exp": now + _JWT_EXPIRY_HOURS * 3600,
     }
     return jwt.encode(payload, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
 
 
+def _verify_token(token: str) -> None:
+    """Verify *token*, raising ``jwt.InvalidTokenError`` if it is not valid.
+
+    Tokens that verified successfully are remembered in ``_jwt_cache`` so that
+    repeat requests with the same bearer token skip the HMAC check and only
+    compare the cached expiry against the clock.  Failed tokens are never cached.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+    # A single dict.get is atomic, so the hit path takes no lock; the lock
+    # only serialises inserts and evictions.
+    valid_until = _jwt_cache.get(key)
+    if valid_until is not None and now < valid_until:
+        return
+
+    # One verified decode; its payload is the only source of claims.
+    payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGORITHMS,
+                         options=_JWT_DECODE_OPTIONS)
+    valid_until = min(float(payload["exp"]), now + _JWT_CACHE_TTL_S)
+    with _jwt_cache_lock:
+        if len(_jwt_cache) >= _JWT_CACHE_SIZE:
+            for stale in [k for k, t in _jwt_cache.items() if t <= now]:
+                del _jwt_cache[stale]
+            if len(_jwt_cache) >= _JWT_CACHE_SIZE:
+                del _jwt_cache[next(iter(_jwt_cache))]  # oldest insertion
+        _jwt_cache[key] = valid_until
+
+
 def require_jwt(f):
     """Decorator: enforce a valid JWT ``Authorization: Bearer <token>`` header."""
     @wraps(f)
@@ -150,8 +303,11 @@ def require_jwt(f):
         if not auth.startswith("Bearer "):
             return jsonify({"error": "Missing or invalid Authorization header"}), 401
         token = auth[len("Bearer "):]
+        if token.count(".") != 2:
+            # Not a compact JWS (header.payload.signature); skip hashing/decoding.
+            return jsonify({"error": "Invalid token"}), 401
         try:
-            jwt.decode(token, _JWT_SECRET, algorithms=[_JWT_ALGORITHM])
+            _verify_token(token)
         except jwt.ExpiredSignatureError:
             return jsonify({"error": "Token has expired"}), 401
         except jwt.InvalidTokenError:
@@ -167,9 +323,12 @@ def ping() -> object:
     """Unauthenticated keepalive endpoint for load-balancers and uptime monitors.
 
     Also returns ``default_key_active`` so the dashboard can auto-connect when
-    no custom ``API_KEY`` environment variable has been configured.
+    no custom ``API_KEY`` environment variable has been configured.  The body
+    never changes, so shared caches in front of the service may answer
+    health checks for up to a second.
     """
-    return jsonify({"pong": True, "default_key_active": _USING_DEFAULT_KEY})
+    return Response(_PING_BODY, mimetype="application/json",
+                    headers={"Cache-Control": "public, max-age=1"})
 
 
 @app.route("/api/auth/token", methods=["POST"])
@@ -185,7 +344,9 @@ def api_auth_token() -> object:
     token : str  A signed JWT to use as ``Authorization: Bearer <token>``.
     """
     body = request.get_json(force=True, silent=True) or {}
-    if body.get("key") != _API_KEY:
+    key = body.get("key")
+    supplied = hashlib.sha256(key.encode()).digest() if isinstance(key, str) else b""
+    if not hmac.compare_digest(supplied, _API_KEY_DIGEST):
         logger.warning("Token request rejected — invalid API key")
         return jsonify({"error": "Invalid API key"}), 401
     token = _make_token()
@@ -195,8 +356,16 @@ def api_auth_token() -> object:
 
 @app.route("/")
 def index() -> object:
-    """Serve the dashboard UI."""
-    return send_from_directory(app.static_folder, "index.html")
+    """Serve the dashboard UI.
+
+    Browsers may reuse it for ``_INDEX_MAX_AGE_S`` seconds and then
+    revalidate with ``If-None-Match``, which is answered with an empty 304.
+    """
+    rv = Response(_INDEX_HTML, mimetype="text/html")
+    rv.set_etag(_INDEX_ETAG)
+    rv.cache_control.public = True
+    rv.cache_control.max_age = _INDEX_MAX_AGE_S
+    return rv.make_conditional(request)
 
 
 @app.route("/api/status")
@@ -224,14 +393,54 @@ def api_logs() -> object:
         n = min(int(request.args.get("n", 50)), LOG_BUFFER_SIZE)
     except ValueError:
         n = 50
-    return jsonify(list(_log_buffer)[-n:])
+    with _log_lock:
+        end = _log_idx
+        start = max(0, end - max(n, 0))
+        recent = [_log_ring[i % LOG_BUFFER_SIZE] for i in range(start, end)]
+    entries = [
+        {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(created)),
+            "level": level,
+            "msg": msg,
+        }
+        for created, level, msg in recent
+    ]
+    return Response(orjson.dumps(entries), mimetype="application/json")
+
+
+def _encoded_config(config: dict) -> tuple:
+    """Return ``(json_body, etag)`` for a configuration snapshot.
+
+    Snapshots are never mutated, so the encoding is reused for as long as
+    *config* is the published ``_config`` object; the first GET after a
+    POST /api/config re-encodes.  The ETag is a hash of the body itself.
+    """
+    global _config_encoded
+    cached = _config_encoded
+    if cached[0] is config:
+        return cached[1], cached[2]
+    body = orjson.dumps(config, option=orjson.OPT_SERIALIZE_NUMPY)
+    etag = hashlib.sha256(body).hexdigest()[:16]
+    _config_encoded = (config, body, etag)
+    return body, etag
 
 
 @app.route("/api/config", methods=["GET"])
 @require_jwt
 def api_get_config() -> object:
-    """Return the current operator configuration."""
-    return jsonify(dict(_config))
+    """Return the current operator configuration.
+
+    The body is encoded once per configuration snapshot and carries an
+    ``ETag``; a request with a matching ``If-None-Match`` gets an empty ``304``.
+    """
+    body, etag = _encoded_config(_config)
+    headers = {"Cache-Control": "private, no-cache"}
+    if request.if_none_match.contains(etag):
+        rv = Response(status=304, headers=headers)
+    else:
+        rv = Response(body, mimetype="application/json", headers=headers)
+    rv.set_etag(etag)
+    return rv
 
 
 @app.route("/api/config", methods=["POST"])
@@ -246,6 +455,7 @@ def api_set_config() -> object:
     baseline_samples : int
     fs               : float (sample rate Hz)
     """
+    global _config
     data = request.get_json(force=True, silent=True) or {}
     updated = {}
     for key, cast in (
@@ -256,13 +466,18 @@ def api_set_config() -> object:
     ):
         if key in data:
             try:
-                _config[key] = cast(data[key])
-                updated[key] = _config[key]
+                updated[key] = cast(data[key])
             except (ValueError, TypeError) as exc:
                 logger.warning("Config update rejected for %s: %s", key, exc)
     if updated:
+        with _config_lock:
+            _config = config = {**_config, **updated}
+        with _run_cache_lock:
+            _run_cache.clear()
         logger.info("Configuration updated: %s", updated)
-    return jsonify({"status": "ok", "config": dict(_config)})
+    else:
+        config = _config
+    return jsonify({"status": "ok", "config": config})
 
 
 @app.route("/api/metrics")
@@ -275,57 +490,116 @@ def api_metrics() -> object:
     error.  This enables newly authenticated users to see existing in-memory
     results without requiring a database.
     """
-    return jsonify(dict(_last_metrics))
+    return jsonify(_last_metrics)  # one reference — a consistent snapshot
 
 
-@app.route("/api/run", methods=["POST"])
-@require_jwt
-def api_run() -> object:
-    """Run the phase–memory operator on a synthetic respiratory signal.
+@lru_cache(maxsize=8)
+def _synthetic_signal(duration_s: float, fs: int) -> tuple:
+    """Memoised ``generate_synthetic_resp`` for repeated demo runs.
 
-    Returns summary metrics derived from the operator output (PAPER.md §4).
-    Use POST body JSON ``{"duration_s": 90}`` to control signal length.
+    The generator is deterministic for fixed arguments (fixed seed), so a
+    repeat run with the same duration and fs reuses the signal.  The cached
+    array is marked read-only; ``run_pipeline`` never writes to its input.
     """
-    if not _run_lock.acquire(blocking=False):
-        logger.warning("Run requested while another run is in progress — rejected")
-        return jsonify({"error": "A run is already in progress"}), 429
+    data = generate_synthetic_resp(duration_s=duration_s, fs=fs)
+    signal = data["signal"]
+    signal.setflags(write=False)
+    return signal, data["fs"]
+
+
+def _run_cache_key(duration_s: float, config: dict) -> tuple:
+    return (
+        duration_s,
+        config["memory_samples"],
+        config["alpha"],
+        config["baseline_samples"],
+        config["fs"],
+    )
 
-    try:
-        body = request.get_json(force=True, silent=True) or {}
-        duration_s = float(body.get("duration_s", 90))
 
+def _pipeline_worker(duration_s: float, config: dict) -> dict:
+    """Generate the signal, run the pipeline and return the summary metrics.
+
+    Executes in the ``_pipeline_pool`` subprocess, so it must stay a
+    module-level function with picklable arguments and return value.  Only the
+    small metrics dict crosses the process boundary — the signal is generated
+    in the worker and never pickled.
+    """
+    # Generate synthetic respiratory signal (PAPER.md §5.1 regimes)
+    signal, fs = _synthetic_signal(duration_s, int(config["fs"]))
+
+    # Run the full phase–memory pipeline (PAPER.md §7.1)
+    result = run_pipeline(
+        signal,
+        fs=float(fs),
+        M=int(config["memory_samples"]),
+        alpha=float(config["alpha"]),
+        baseline_samples=int(config["baseline_samples"]),
+    )
+
+    # One reduction per statistic: the alarm rate is derived from the
+    # count instead of re-scanning the instability mask with .mean().
+    instability = result["instability"]
+    delta_phi = result["delta_phi"]
+    inst_count = int(np.count_nonzero(instability))
+    inst_rate = inst_count / instability.size if instability.size else 0.0
+
+    return {
+        "sigma_omega":       round(float(result["sigma_omega"]),  6),
+        "threshold":         round(float(result["threshold"]),    6),
+        "instability_count": inst_count,
+        "instability_rate":  round(inst_rate, 4),
+        "delta_phi_max":     round(float(delta_phi.max()),  4),
+        "delta_phi_mean":    round(float(delta_phi.mean()), 4),
+        "n_samples":         int(len(signal)),
+        "duration_s":        round(float(len(signal) / fs), 1),
+    }
+
+
+def _get_pipeline_pool() -> ProcessPoolExecutor:
+    """Return the pipeline subprocess pool, creating it on first use.
+
+    Shared by operator runs and the per-record work of /api/validate.
+
+    Created lazily so that importing the app (tests, the gunicorn master)
+    does not start a process, and with the ``spawn`` start method because
+    forking a multi-threaded server process is unsafe.
+    """
+    global _pipeline_pool
+    with _pipeline_pool_lock:
+        if _pipeline_pool is None:
+            _pipeline_pool = ProcessPoolExecutor(
+                max_workers=_RUN_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pipeline_pool
+
+
+def _do_run(duration_s: float, config: dict) -> dict:
+    """Execute one operator run on the background executor and return its metrics.
+
+    Runs on ``_run_executor``'s worker thread with a snapshot of ``_config``
+    taken when the job was submitted.  The NumPy work itself is delegated to
+    ``_pipeline_worker`` in a subprocess, so it never holds this process's GIL
+    while /ping, /api/status and /api/logs are being served.  Releases its
+    ``_run_slots`` slot when done so another POST /api/run is accepted.
+    """
+    global _last_metrics
+    try:
         logger.info(
             "Operator run started — duration=%.0fs  M=%d  α=%.2f  fs=%.0f Hz",
-            duration_s, _config["memory_samples"], _config["alpha"], _config["fs"],
+            duration_s, config["memory_samples"], config["alpha"], config["fs"],
         )
 
-        # Generate synthetic respiratory signal (PAPER.md §5.1 regimes)
-        data = generate_synthetic_resp(duration_s=duration_s, fs=int(_config["fs"]))
-        signal = data["signal"]
-        fs = data["fs"]
-
-        # Run the full phase–memory pipeline (PAPER.md §7.1)
-        result = run_pipeline(
-            signal,
-            fs=float(fs),
-            M=int(_config["memory_samples"]),
-            alpha=float(_config["alpha"]),
-            baseline_samples=int(_config["baseline_samples"]),
-        )
+        metrics = _get_pipeline_pool().submit(_pipeline_worker, duration_s, config).result()
 
-        metrics = {
-            "sigma_omega":       round(float(result["sigma_omega"]),  6),
-            "threshold":         round(float(result["threshold"]),    6),
-            "instability_count": int(result["instability"].sum()),
-            "instability_rate":  round(float(result["instability"].mean()), 4),
-            "delta_phi_max":     round(float(result["delta_phi"].max()),    4),
-            "delta_phi_mean":    round(float(result["delta_phi"].mean()),   4),
-            "n_samples":         int(len(signal)),
-            "duration_s":        round(float(len(signal) / fs), 1),
-        }
+        _last_metrics = metrics
 
-        _last_metrics.clear()
-        _last_metrics.update(metrics)
+        now = time.time()
+        with _run_cache_lock:
+            if len(_run_cache) >= _RUN_CACHE_SIZE:
+                del _run_cache[next(iter(_run_cache))]  # oldest insertion
+            _run_cache[_run_cache_key(duration_s, config)] = (now + _RUN_CACHE_TTL_S, metrics)
 
         logger.info(
             "Operator run complete — σ_ω=%.4f rad/s  threshold=%.4f rad/s  "
@@ -335,29 +609,161 @@ def api_run() -> object:
             metrics["instability_rate"] * 100,
             metrics["instability_count"],
         )
+        return metrics
 
-        return jsonify({"status": "ok", "metrics": metrics})
+    except Exception as exc:
+        logger.error("Operator run failed: %s", exc, exc_info=True)
+        raise
 
+    finally:
+        _run_slots.release()
+
+
+@app.route("/api/run", methods=["POST"])
+@require_jwt
+def api_run() -> object:
+    """Start the phase–memory operator on a synthetic respiratory signal.
+
+    The run executes in the background; the response is ``202`` with a
+    ``job_id`` to poll via ``GET /api/run/<job_id>``.  If an identical run
+    (same duration and configuration) completed within the last
+    ``_RUN_CACHE_TTL_S`` seconds, its metrics are returned immediately with
+    ``200`` and ``"cached": true``.  Use POST body JSON ``{"duration_s": 90}``
+    to control signal length.
+    """
+    global _last_metrics
+    body = request.get_json(force=True, silent=True) or {}
+    try:
+        duration_s = float(body.get("duration_s", 90))
+    except (ValueError, TypeError):
+        return jsonify({"error": "duration_s must be a number"}), 400
+
+    config = _config  # immutable snapshot — safe to hand to the background job
+    key = _run_cache_key(duration_s, config)
+    with _run_cache_lock:
+        hit = _run_cache.get(key)
+    if hit is not None and time.time() < hit[0]:
+        metrics = hit[1]
+        _last_metrics = metrics
+        logger.info("Operator run served from cache — duration=%.0fs", duration_s)
+        return jsonify({"status": "ok", "metrics": metrics, "cached": True})
+
+    if not _run_slots.acquire(blocking=False):
+        logger.warning("Run requested while all %d run slots are busy — rejected", _RUN_WORKERS)
+        return jsonify({"error": "Too many runs in progress"}), 429
+
+    try:
+        future = _run_executor.submit(_do_run, duration_s, config)
     except Exception as exc:  # pylint: disable=broad-except
-        logger.error("Operator run failed: %s", exc, exc_info=True)
+        _run_slots.release()
+        logger.error("Operator run could not be scheduled: %s", exc)
         return jsonify({"error": str(exc)}), 500
 
-    finally:
-        _run_lock.release()
+    job_id = uuid.uuid4().hex
+    with _run_jobs_lock:
+        if len(_run_jobs) >= _RUN_JOBS_MAX:
+            # Forget the least recently used *finished* job; a running job
+            # must stay pollable until its result has been collected.
+            finished = next((jid for jid, f in _run_jobs.items() if f.done()), None)
+            if finished is not None:
+                del _run_jobs[finished]
+        _run_jobs[job_id] = future
+    return jsonify({"status": "pending", "job_id": job_id}), 202
+
+
+@app.route("/api/run/<job_id>")
+@require_jwt
+def api_run_status(job_id: str) -> object:
+    """Poll a job started by ``POST /api/run``.
+
+    Returns ``202`` while the run is pending, ``200`` with the summary metrics
+    (PAPER.md §4) once it has finished, ``500`` if it failed and ``404`` for an
+    unknown or expired job id.
+    """
+    with _run_jobs_lock:
+        future = _run_jobs.get(job_id)
+        if future is not None:
+            _run_jobs.move_to_end(job_id)
+    if future is None:
+        return jsonify({"error": "Unknown job id"}), 404
+    if not future.done():
+        return jsonify({"status": "pending", "job_id": job_id}), 202
+    exc = future.exception()
+    if exc is not None:
+        return jsonify({"error": str(exc)}), 500
+    return jsonify({"status": "ok", "metrics": future.result()})
 
 
 # ── Validation helpers ──────────────────────────────────────────────────────────
 
-def _read_results_csv(filename: str) -> list:
-    """Read a CSV from RESULTS_DIR and return list of row dicts."""
+def _read_results_csv(filename: str) -> tuple:
+    """Read a CSV from RESULTS_DIR and return ``(header, rows)``.
+
+    *header* is the list of column names and *rows* a list of value tuples in
+    the same column order (``([], [])`` if the file does not exist).  Parsed
+    tables are memoised per file and reused until its signature (see
+    ``_file_signature``) changes; callers must treat them as read-only.
+    """
     path = RESULTS_DIR / filename
-    if not path.exists():
-        return []
+    try:
+        signature = _file_signature(path)
+    except FileNotFoundError:
+        return [], []
+    with _csv_cache_lock:
+        hit = _csv_cache.get(filename)
+    if hit is not None and hit[0] == signature:
+        return hit[1]
     with open(path, newline="") as fh:
-        return list(csv.DictReader(fh))
+        reader = csv.reader(fh)
+        header = next(reader, [])
+        table = (header, [tuple(row) for row in reader])
+    with _csv_cache_lock:
+        _csv_cache[filename] = (signature, table)
+    return table
+
+
+def _file_signature(path) -> tuple:
+    """Return ``(st_mtime_ns, st_size, st_ino)`` for *path*.
+
+    Size and inode catch most rewrites (or replacements) that land within
+    one mtime tick on filesystems with coarse timestamps; api_validate also
+    clears the caches built on it.
+    """
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
 
+def _results_snapshot() -> tuple:
+    """Return the ``_file_signature`` of metrics.csv and summary.csv (``None`` if absent)."""
+    return tuple(
+        _file_signature(p) if p.exists() else None
+        for p in (RESULTS_DIR / "metrics.csv", RESULTS_DIR / "summary.csv")
+    )
+
+
+def _cached_report(builder, key: tuple, metrics: tuple, summary: tuple) -> bytes:
+    """Return ``builder(metrics, summary, n_records)``, memoised on *key*.
 
-def _build_pdf(rows: list, summary_rows: list, n_records: int) -> bytes:
+    *metrics* and *summary* are ``(header, rows)`` tables from
+    ``_read_results_csv``.  *key* must be taken with ``_results_snapshot()``
+    before the tables are read,
+    so that a report is never stored under a newer key than its inputs.
+    """
+    key = (builder.__name__, key)
+    with _doc_cache_lock:
+        data = _doc_cache.get(key)
+        if data is not None:
+            _doc_cache.move_to_end(key)
+            return data
+    data = builder(metrics, summary, len(metrics[1]))
+    with _doc_cache_lock:
+        _doc_cache[key] = data
+        while len(_doc_cache) > _DOC_CACHE_SIZE:
+            _doc_cache.popitem(last=False)
+    return data
+
+
+def _build_pdf(metrics: tuple, summary: tuple, n_records: int) -> bytes:
     """Generate a PDF report from validation results using reportlab."""
     try:
         from reportlab.lib.pagesizes import A4
@@ -385,9 +791,9 @@ def _build_pdf(rows: list, summary_rows: list, n_records: int) -> bytes:
 
     # Table 1 — per-record metrics
     elements.append(Paragraph("Table 1: Per-Record Metrics", styles["Heading2"]))
+    header, rows = metrics
     if rows:
-        header = list(rows[0].keys())
-        table_data = [header] + [[r.get(k, "") or "—" for k in header] for r in rows]
+        table_data = [header] + [[v or "—" for v in r] for r in rows]
         t = Table(table_data, hAlign="LEFT")
         t.setStyle(TableStyle([
             ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4f8ef7")),
@@ -407,9 +813,9 @@ def _build_pdf(rows: list, summary_rows: list, n_records: int) -> bytes:
 
     # Table 2 — aggregated stats
     elements.append(Paragraph("Table 2: Aggregated Statistics (Mean ± SD)", styles["Heading2"]))
+    header2, summary_rows = summary
     if summary_rows:
-        header2 = list(summary_rows[0].keys())
-        table_data2 = [header2] + [[r.get(k, "") or "—" for k in header2] for r in summary_rows]
+        table_data2 = [header2] + [[v or "—" for v in r] for r in summary_rows]
         t2 = Table(table_data2, hAlign="LEFT")
         t2.setStyle(TableStyle([
             ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3ecf8e")),
@@ -430,7 +836,7 @@ def _build_pdf(rows: list, summary_rows: list, n_records: int) -> bytes:
     return buf.getvalue()
 
 
-def _build_docx(rows: list, summary_rows: list, n_records: int) -> bytes:
+def _build_docx(metrics: tuple, summary: tuple, n_records: int) -> bytes:
     """Generate a DOCX report from validation results using python-docx."""
     try:
         from docx import Document
@@ -449,32 +855,36 @@ def _build_docx(rows: list, summary_rows: list, n_records: int) -> bytes:
 
     # Table 1 — per-record metrics
     doc.add_heading("Table 1: Per-Record Metrics", level=2)
+    header, rows = metrics
     if rows:
-        header = list(rows[0].keys())
         tbl = doc.add_table(rows=1 + len(rows), cols=len(header))
         tbl.style = "Light List Accent 1"
-        for j, h in enumerate(header):
-            tbl.rows[0].cells[j].text = h
-            tbl.rows[0].cells[j].paragraphs[0].runs[0].bold = True
-        for i, row in enumerate(rows, start=1):
-            for j, k in enumerate(header):
-                tbl.rows[i].cells[j].text = str(row.get(k, "") or "—")
+        # Table.rows / Row.cells rebuild their proxy lists on every access,
+        # so fetch each row's cells once instead of indexing per cell.
+        table_rows = iter(tbl.rows)
+        for cell, h in zip(next(table_rows).cells, header):
+            cell.text = h
+            cell.paragraphs[0].runs[0].bold = True
+        for table_row, row in zip(table_rows, rows):
+            for cell, value in zip(table_row.cells, row):
+                cell.text = value or "—"
     else:
         doc.add_paragraph("No per-record results available.")
     doc.add_paragraph()
 
     # Table 2 — aggregated stats
     doc.add_heading("Table 2: Aggregated Statistics (Mean ± SD)", level=2)
+    header2, summary_rows = summary
     if summary_rows:
-        header2 = list(summary_rows[0].keys())
         tbl2 = doc.add_table(rows=1 + len(summary_rows), cols=len(header2))
         tbl2.style = "Light List Accent 1"
-        for j, h in enumerate(header2):
-            tbl2.rows[0].cells[j].text = h
-            tbl2.rows[0].cells[j].paragraphs[0].runs[0].bold = True
-        for i, row in enumerate(summary_rows, start=1):
-            for j, k in enumerate(header2):
-                tbl2.rows[i].cells[j].text = str(row.get(k, "") or "—")
+        table_rows = iter(tbl2.rows)
+        for cell, h in zip(next(table_rows).cells, header2):
+            cell.text = h
+            cell.paragraphs[0].runs[0].bold = True
+        for table_row, row in zip(table_rows, summary_rows):
+            for cell, value in zip(table_row.cells, row):
+                cell.text = value or "—"
     else:
         doc.add_paragraph("No summary results available.")
 
@@ -483,6 +893,121 @@ def _build_docx(rows: list, summary_rows: list, n_records: int) -> bytes:
     return buf.getvalue()
 
 
+def _encoded_attachments(key: tuple, metrics: tuple, summary: tuple) -> list:
+    """Return the base64-encoded MIME parts for the results email.
+
+    The CSVs, PDF and DOCX are rendered from the *metrics* and *summary*
+    tables and encoded once per results snapshot (*key*, from
+    ``_results_snapshot()``), then reused for every recipient.  The CSVs are
+    re-serialised from those same tables rather than re-read from disk, so a
+    rewrite landing mid-request can never pair them with reports from another
+    run.  Callers attach ``copy.copy`` of each part.
+    """
+    with _mime_cache_lock:
+        parts = _mime_cache.get(key)
+    if parts is not None:
+        return parts
+
+    # (filename, mimetype, data)
+    attachments = []
+
+    for name, (header, rows) in (("metrics.csv", metrics), ("summary.csv", summary)):
+        if header:
+            buf = io.StringIO(newline="")
+            writer = csv.writer(buf)
+            writer.writerow(header)
+            writer.writerows(rows)
+            attachments.append((name, "text/csv", buf.getvalue().encode()))
+
+    try:
+        pdf_bytes = _cached_report(_build_pdf, key, metrics, summary)
+        attachments.append(("results.pdf", "application/pdf", pdf_bytes))
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.warning("PDF generation skipped for email: %s", exc)
+
+    try:
+        docx_bytes = _cached_report(_build_docx, key, metrics, summary)
+        attachments.append((
+            "results.docx",
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            docx_bytes,
+        ))
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.warning("DOCX generation skipped for email: %s", exc)
+
+    parts = []
+    for filename, mimetype, data in attachments:
+        main_type, sub_type = mimetype.split("/", 1)
+        part = MIMEPart()
+        part.set_content(data, maintype=main_type, subtype=sub_type,
+                         disposition="attachment", filename=filename)
+        parts.append(part)
+
+    with _mime_cache_lock:
+        _mime_cache.clear()  # only the current results snapshot is worth keeping
+        _mime_cache[key] = parts
+    return parts
+
+
+def _smtp_connect() -> smtplib.SMTP:
+    """Open and authenticate an SMTP connection from the SMTP_* environment."""
+    smtp_host = os.environ.get("SMTP_HOST", "localhost")
+    smtp_port = int(os.environ.get("SMTP_PORT", 587))
+    smtp_user = os.environ.get("SMTP_USER", "")
+    smtp_pass = os.environ.get("SMTP_PASS", "")
+
+    if smtp_port == 465:
+        # Port 465 uses implicit SSL (SMTPS) — cannot use STARTTLS
+        server = smtplib.SMTP_SSL(smtp_host, smtp_port, timeout=10)
+        server.ehlo()
+    else:
+        server = smtplib.SMTP(smtp_host, smtp_port, timeout=10)
+        server.ehlo()
+        if smtp_port != 25:
+            server.starttls()
+            server.ehlo()
+    if smtp_user:
+        server.login(smtp_user, smtp_pass)
+    return server
+
+
+def _smtp_close() -> None:
+    """Drop the shared SMTP connection (caller holds ``_smtp_lock``)."""
+    global _smtp_conn
+    conn, _smtp_conn = _smtp_conn, None
+    if conn is not None:
+        try:
+            conn.close()
+        except OSError:
+            pass
+
+
+def _smtp_send(msg: EmailMessage) -> None:
+    """Send *msg* over the shared SMTP connection, (re)connecting as needed.
+
+    Sender and recipients are taken from the message's From/To headers.
+
+    The connection is kept open between calls.  If the server has dropped it
+    while idle, one reconnect is attempted; any other failure closes it so
+    the next call starts fresh.
+    """
+    global _smtp_conn
+    with _smtp_lock:
+        for attempt in range(2):
+            try:
+                if _smtp_conn is None:
+                    _smtp_conn = _smtp_connect()
+                _smtp_conn.send_message(msg)
+                return
+            except smtplib.SMTPServerDisconnected:
+                _smtp_close()
+                if attempt:
+                    raise
+            except Exception:
+                _smtp_close()
+                raise
+
+
 # ── Validation routes ───────────────────────────────────────────────────────────
 
 @app.route("/api/validate", methods=["POST"])
@@ -517,10 +1042,19 @@ def api_validate() -> object:
             n_records, use_synthetic,
         )
 
+        # Records are independent; fan them out over the pipeline subprocesses
+        # (a single record runs inline rather than starting the pool for it).
         result = run_multi_record_validation(
             n_records=n_records,
             use_synthetic=use_synthetic,
+            executor=_get_pipeline_pool() if n_records > 1 else None,
         )
+        with _doc_cache_lock:
+            _doc_cache.clear()
+        with _csv_cache_lock:
+            _csv_cache.clear()
+        with _mime_cache_lock:
+            _mime_cache.clear()
 
         logger.info(
             "Multi-record validation complete — n_records=%d  "
@@ -566,13 +1100,13 @@ def api_results_summary_csv() -> object:
 @require_jwt
 def api_results_pdf() -> object:
     """Download an auto-generated PDF report of the validation results."""
-    rows = _read_results_csv("metrics.csv")
-    summary_rows = _read_results_csv("summary.csv")
-    if not rows and not summary_rows:
+    key = _results_snapshot()
+    metrics = _read_results_csv("metrics.csv")
+    summary = _read_results_csv("summary.csv")
+    if not metrics[1] and not summary[1]:
         return jsonify({"error": "No results found — run /api/validate first"}), 404
-    n_records = len(rows)
     try:
-        pdf_bytes = _build_pdf(rows, summary_rows, n_records)
+        pdf_bytes = _cached_report(_build_pdf, key, metrics, summary)
     except RuntimeError as exc:
         return jsonify({"error": str(exc)}), 500
     return send_file(
@@ -585,13 +1119,13 @@ def api_results_pdf() -> object:
 @require_jwt
 def api_results_docx() -> object:
     """Download an auto-generated DOCX report of the validation results."""
-    rows = _read_results_csv("metrics.csv")
-    summary_rows = _read_results_csv("summary.csv")
-    if not rows and not summary_rows:
+    key = _results_snapshot()
+    metrics = _read_results_csv("metrics.csv")
+    summary = _read_results_csv("summary.csv")
+    if not metrics[1] and not summary[1]:
         return jsonify({"error": "No results found — run /api/validate first"}), 404
-    n_records = len(rows)
     try:
-        docx_bytes = _build_docx(rows, summary_rows, n_records)
+        docx_bytes = _cached_report(_build_docx, key, metrics, summary)
     except RuntimeError as exc:
         return jsonify({"error": str(exc)}), 500
     return send_file(
@@ -623,48 +1157,17 @@ def api_send_results() -> object:
     if not recipient or "@" not in recipient:
         return jsonify({"error": "A valid email address is required"}), 400
 
-    rows = _read_results_csv("metrics.csv")
-    summary_rows = _read_results_csv("summary.csv")
-    if not rows and not summary_rows:
+    key = _results_snapshot()
+    metrics = _read_results_csv("metrics.csv")
+    summary = _read_results_csv("summary.csv")
+    if not metrics[1] and not summary[1]:
         return jsonify({"error": "No results found — run /api/validate first"}), 404
 
-    n_records = len(rows)
-
-    # Build attachments
-    attachments = []
-
-    # metrics.csv
-    metrics_path = RESULTS_DIR / "metrics.csv"
-    if metrics_path.exists():
-        with open(metrics_path, "rb") as fh:
-            attachments.append(("metrics.csv", "text/csv", fh.read()))
-
-    # summary.csv
-    summary_path = RESULTS_DIR / "summary.csv"
-    if summary_path.exists():
-        with open(summary_path, "rb") as fh:
-            attachments.append(("summary.csv", "text/csv", fh.read()))
-
-    # results.pdf
-    try:
-        pdf_bytes = _build_pdf(rows, summary_rows, n_records)
-        attachments.append(("results.pdf", "application/pdf", pdf_bytes))
-    except Exception as exc:  # pylint: disable=broad-except
-        logger.warning("PDF generation skipped for email: %s", exc)
-
-    # results.docx
-    try:
-        docx_bytes = _build_docx(rows, summary_rows, n_records)
-        attachments.append((
-            "results.docx",
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            docx_bytes,
-        ))
-    except Exception as exc:  # pylint: disable=broad-except
-        logger.warning("DOCX generation skipped for email: %s", exc)
+    n_records = len(metrics[1])
+    parts = _encoded_attachments(key, metrics, summary)
 
     # Build MIME message
-    msg = MIMEMultipart()
+    msg = EmailMessage()
     smtp_from = os.environ.get("SMTP_FROM", "respirosync@localhost")
     msg["From"] = smtp_from
     msg["To"] = recipient
@@ -675,39 +1178,14 @@ def api_send_results() -> object:
         "the semi-synthetic perturbation protocol described in Section 5.\n\n"
         "— RespiroSync"
     )
-    msg.attach(MIMEText(body_text, "plain"))
-
-    for filename, mimetype, data in attachments:
-        main_type, sub_type = mimetype.split("/", 1)
-        part = MIMEBase(main_type, sub_type)
-        part.set_payload(data)
-        encoders.encode_base64(part)
-        part.add_header("Content-Disposition", "attachment", filename=filename)
-        msg.attach(part)
+    msg.set_content(body_text)
+    msg.make_mixed()
 
-    # Send via SMTP
-    smtp_host = os.environ.get("SMTP_HOST", "localhost")
-    smtp_port = int(os.environ.get("SMTP_PORT", 587))
-    smtp_user = os.environ.get("SMTP_USER", "")
-    smtp_pass = os.environ.get("SMTP_PASS", "")
+    for part in parts:
+        msg.attach(copy.copy(part))
 
     try:
-        if smtp_port == 465:
-            # Port 465 uses implicit SSL (SMTPS) — cannot use STARTTLS
-            with smtplib.SMTP_SSL(smtp_host, smtp_port, timeout=10) as server:
-                server.ehlo()
-                if smtp_user:
-                    server.login(smtp_user, smtp_pass)
-                server.sendmail(smtp_from, [recipient], msg.as_string())
-        else:
-            with smtplib.SMTP(smtp_host, smtp_port, timeout=10) as server:
-                server.ehlo()
-                if smtp_port != 25:
-                    server.starttls()
-                    server.ehlo()
-                if smtp_user:
-                    server.login(smtp_user, smtp_pass)
-                server.sendmail(smtp_from, [recipient], msg.as_string())
+        _smtp_send(msg)
         logger.info("Validation results emailed to %s", recipient)
         return jsonify({"status": "ok", "sent_to": recipient})
     except Exception as exc:  # pylint: disable=broad-except
@@ -717,8 +1195,10 @@ def api_send_results() -> object:
 
 # ── Entry point ─────────────────────────────────────────────────────────────────
 
+# Local development only — production runs under gunicorn (gunicorn.conf.py).
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
     logger.info("RespiroSync dashboard starting on port %d", port)
     logger.info("Pipeline: preprocessing → analytic signal → θ(t) → ω(t) → ω̄(t) → ΔΦ(t)")
-    app.run(host="0.0.0.0", port=port, debug=False)
+    # Werkzeug's threaded server handles each request on its own thread.
+    app.run(host="0.0.0.0", port=port, debug=False, threaded=True)
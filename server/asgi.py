@@ -0,0 +1,33 @@
+"""
+RespiroSync Dashboard Server — ASGI entry point
+================================================
+Exposes the Flask application from server/app.py as an ASGI callable for
+hosts that can only run ASGI servers:
+
+    uvicorn server.asgi:asgi_app
+
+Routes and behaviour are identical to the WSGI deployment, but concurrency is
+worse.  asgiref's WsgiToAsgi calls the WSGI app through
+``sync_to_async(thread_sensitive=True)``, so every Flask view runs on one
+shared thread: a slow view (/api/validate, /api/send-results, the PDF/DOCX
+reports) blocks every other request, /ping and /api/status included.  Prefer
+the threaded gunicorn deployment (gunicorn -c gunicorn.conf.py server.app:app).
+
+Keep a single uvicorn worker: operator configuration, last-run metrics and the
+log buffer are held in process memory (see gunicorn.conf.py).
+
+Requires the optional packages ``asgiref`` and ``uvicorn``.
+"""
+
+try:
+    from asgiref.wsgi import WsgiToAsgi
+except ImportError as exc:  # pragma: no cover - optional dependency
+    raise ImportError(
+        "asgiref package required for the ASGI entry point.  Install with:\n"
+        "    pip install asgiref uvicorn\n"
+        "or serve the WSGI app with gunicorn -c gunicorn.conf.py server.app:app"
+    ) from exc
+
+from server.app import app
+
+asgi_app = WsgiToAsgi(app)
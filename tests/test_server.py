@@ -4,6 +4,7 @@ Tests for JWT authentication and /ping keepalive endpoint in server/app.py.
 
 import sys
 import os
+import time
 import pytest
 
 # Ensure the repo root is on the path so server/app.py can import validation/
@@ -16,15 +17,34 @@ os.environ.setdefault("API_KEY", "test-api-key")
 from server.app import app, _make_token, _API_KEY  # noqa: E402
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def results_dir(tmp_path_factory):
+    # /api/validate writes metrics.csv and summary.csv; send them to a temp
+    # directory so the suite never leaves files in the repo's results/.
+    from server import app as app_module
+    from validation import multi_record_validation
+
+    path = tmp_path_factory.mktemp("results")
+    mp = pytest.MonkeyPatch()
+    mp.setattr(app_module, "RESULTS_DIR", path)
+    mp.setattr(multi_record_validation, "RESULTS_DIR", path)
+    mp.setattr(multi_record_validation, "CACHE_DIR", path / "cache")
+    yield path
+    mp.undo()
+
+
+@pytest.fixture(scope="session")
 def client():
+    # The app is a module-level singleton, so one test client serves the
+    # whole session; tests must not rely on client-side cookie state.
     app.config["TESTING"] = True
     with app.test_client() as c:
         yield c
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_headers():
+    # Valid for _JWT_EXPIRY_HOURS, far longer than a test session.
     token = _make_token()
     return {"Authorization": f"Bearer {token}"}
 
@@ -49,12 +69,35 @@ def test_ping_default_key_active_with_custom_key(client):
     assert data["default_key_active"] is False
 
 
+def test_ping_is_briefly_cacheable(client):
+    rv = client.get("/ping")
+    assert rv.headers["Cache-Control"] == "public, max-age=1"
+
+
 def test_ping_needs_no_auth(client):
     """Ping must succeed without any Authorization header."""
     rv = client.get("/ping")
     assert rv.status_code == 200
 
 
+# ── / (dashboard) ───────────────────────────────────────────────────────────────
+
+def test_index_serves_dashboard(client):
+    rv = client.get("/")
+    assert rv.status_code == 200
+    assert rv.mimetype == "text/html"
+    assert b"RespiroSync" in rv.data
+
+
+def test_index_revalidates_with_etag(client):
+    rv = client.get("/")
+    assert rv.headers["ETag"]
+    assert "max-age=300" in rv.headers["Cache-Control"]
+    rv2 = client.get("/", headers={"If-None-Match": rv.headers["ETag"]})
+    assert rv2.status_code == 304
+    assert rv2.data == b""
+
+
 # ── /api/auth/token ──────────────────────────────────────────────────────────────
 
 def test_auth_token_valid_key(client):
@@ -101,6 +144,33 @@ def test_api_logs_with_valid_jwt(client, auth_headers):
     assert isinstance(rv.get_json(), list)
 
 
+def test_api_logs_returns_newest_n(client, auth_headers):
+    from server import app as app_module
+    app_module.logger.info("logs-probe-1")
+    app_module.logger.info("logs-probe-2")
+    rv = client.get("/api/logs?n=2", headers=auth_headers)
+    assert [e["msg"] for e in rv.get_json()] == ["logs-probe-1", "logs-probe-2"]
+
+
+def test_api_logs_ring_buffer_wraps(client, auth_headers):
+    from server import app as app_module
+    size = app_module.LOG_BUFFER_SIZE
+    for i in range(size + 7):
+        app_module.logger.info("wrap-probe-%d", i)
+    logs = client.get(f"/api/logs?n={size}", headers=auth_headers).get_json()
+    assert len(logs) == size
+    assert logs[-1]["msg"] == f"wrap-probe-{size + 6}"
+    assert logs[0]["msg"] == "wrap-probe-7"
+
+
+@pytest.fixture
+def restore_config(monkeypatch):
+    # POST /api/config rebinds the process-global _config; put the original
+    # back so later tests see the default operator parameters.
+    from server import app as app_module
+    monkeypatch.setattr(app_module, "_config", dict(app_module._config))
+
+
 def test_api_config_get_requires_jwt(client):
     rv = client.get("/api/config")
     assert rv.status_code == 401
@@ -113,12 +183,35 @@ def test_api_config_get_with_valid_jwt(client, auth_headers):
     assert "memory_samples" in data
 
 
+def test_api_config_get_etag_revalidation(client, auth_headers):
+    first = client.get("/api/config", headers=auth_headers)
+    etag = first.headers["ETag"]
+    rv = client.get("/api/config", headers={**auth_headers, "If-None-Match": etag})
+    assert rv.status_code == 304
+    assert rv.data == b""
+
+
+def test_api_config_etag_changes_after_update(client, auth_headers, restore_config):
+    etag = client.get("/api/config", headers=auth_headers).headers["ETag"]
+    current = client.get("/api/config", headers=auth_headers).get_json()["alpha"]
+    client.post("/api/config", json={"alpha": current + 0.25}, headers=auth_headers)
+    rv = client.get("/api/config", headers={**auth_headers, "If-None-Match": etag})
+    assert rv.status_code == 200
+    assert rv.headers["ETag"] != etag
+
+
+def test_api_config_get_reflects_update(client, auth_headers, restore_config):
+    current = client.get("/api/config", headers=auth_headers).get_json()["alpha"]
+    client.post("/api/config", json={"alpha": current + 0.5}, headers=auth_headers)
+    assert client.get("/api/config", headers=auth_headers).get_json()["alpha"] == current + 0.5
+
+
 def test_api_config_post_requires_jwt(client):
     rv = client.post("/api/config", json={})
     assert rv.status_code == 401
 
 
-def test_api_config_post_with_valid_jwt(client, auth_headers):
+def test_api_config_post_with_valid_jwt(client, auth_headers, restore_config):
     rv = client.post("/api/config", json={"alpha": 2.5}, headers=auth_headers)
     assert rv.status_code == 200
     assert rv.get_json()["status"] == "ok"
@@ -135,12 +228,65 @@ def test_invalid_bearer_token(client):
     assert "error" in rv.get_json()
 
 
+def test_malformed_token_rejected_before_decode(client, monkeypatch):
+    from server import app as app_module
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("jwt.decode must not be reached")
+
+    monkeypatch.setattr(app_module.jwt, "decode", fail_decode)
+    rv = client.get("/api/status", headers={"Authorization": "Bearer not-a-real-token"})
+    assert rv.status_code == 401
+    assert rv.get_json()["error"] == "Invalid token"
+
+
 def test_missing_bearer_prefix(client):
     token = _make_token()
     rv = client.get("/api/status", headers={"Authorization": token})
     assert rv.status_code == 401
 
 
+def test_token_without_exp_is_rejected(client):
+    import jwt
+    from server import app as app_module
+    token = jwt.encode({"sub": "respirosync", "iat": int(time.time())},
+                       app_module._JWT_SECRET, algorithm=app_module._JWT_ALGORITHM)
+    rv = client.get("/api/status", headers={"Authorization": f"Bearer {token}"})
+    assert rv.status_code == 401
+
+
+# ── JWT verification cache ──────────────────────────────────────────────────────
+
+def test_verified_token_is_cached(client, auth_headers):
+    from server import app as app_module
+    app_module._jwt_cache.clear()
+    assert client.get("/api/status", headers=auth_headers).status_code == 200
+    assert len(app_module._jwt_cache) == 1
+    assert client.get("/api/status", headers=auth_headers).status_code == 200
+    assert len(app_module._jwt_cache) == 1
+
+
+def test_invalid_token_is_not_cached(client):
+    from server import app as app_module
+    app_module._jwt_cache.clear()
+    client.get("/api/status", headers={"Authorization": "Bearer not-a-real-token"})
+    assert len(app_module._jwt_cache) == 0
+
+
+def test_stale_cache_entry_forces_reverification(client):
+    """A cached entry past its deadline must not admit an expired token."""
+    import hashlib
+    import jwt
+    from server import app as app_module
+    expired = jwt.encode({"sub": "respirosync", "iat": 0, "exp": 1}, app_module._JWT_SECRET,
+                         algorithm=app_module._JWT_ALGORITHM)
+    key = hashlib.sha256(expired.encode()).digest()
+    app_module._jwt_cache[key] = 0.0
+    rv = client.get("/api/status", headers={"Authorization": f"Bearer {expired}"})
+    assert rv.status_code == 401
+    assert rv.get_json()["error"] == "Token has expired"
+
+
 # ── /api/validate ────────────────────────────────────────────────────────────────
 
 def test_api_validate_requires_jwt(client):
@@ -189,6 +335,17 @@ def test_api_validate_methods_statement(client, auth_headers):
     assert "Section 5" in ms
 
 
+@pytest.fixture(scope="session")
+def validated_results(client, auth_headers, results_dir):
+    """Populate metrics.csv and summary.csv in results_dir once for the session."""
+    rv = client.post(
+        "/api/validate",
+        json={"n_records": 2, "synthetic": True},
+        headers=auth_headers,
+    )
+    assert rv.status_code == 200
+
+
 # ── /api/results/metrics.csv ─────────────────────────────────────────────────────
 
 def test_api_results_metrics_csv_requires_jwt(client):
@@ -196,13 +353,7 @@ def test_api_results_metrics_csv_requires_jwt(client):
     assert rv.status_code == 401
 
 
-def test_api_results_metrics_csv_after_validate(client, auth_headers):
-    # Run validation first to create the CSV
-    client.post(
-        "/api/validate",
-        json={"n_records": 2, "synthetic": True},
-        headers=auth_headers,
-    )
+def test_api_results_metrics_csv_after_validate(client, auth_headers, validated_results):
     rv = client.get("/api/results/metrics.csv", headers=auth_headers)
     assert rv.status_code == 200
     assert "text/csv" in rv.content_type
@@ -215,17 +366,36 @@ def test_api_results_summary_csv_requires_jwt(client):
     assert rv.status_code == 401
 
 
-def test_api_results_summary_csv_after_validate(client, auth_headers):
-    client.post(
-        "/api/validate",
-        json={"n_records": 2, "synthetic": True},
-        headers=auth_headers,
-    )
+def test_api_results_summary_csv_after_validate(client, auth_headers, validated_results):
     rv = client.get("/api/results/summary.csv", headers=auth_headers)
     assert rv.status_code == 200
     assert "text/csv" in rv.content_type
 
 
+def test_api_results_csv_conditional_get(client, auth_headers, validated_results):
+    rv = client.get("/api/results/metrics.csv", headers=auth_headers)
+    assert rv.status_code == 200
+    assert rv.headers.get("ETag")
+    rv2 = client.get(
+        "/api/results/metrics.csv",
+        headers={**auth_headers, "If-None-Match": rv.headers["ETag"]},
+    )
+    assert rv2.status_code == 304
+    assert rv2.data == b""
+
+
+def test_results_csv_cache_sees_rewrite_within_one_mtime_tick(results_dir):
+    from server import app as app_module
+
+    path = results_dir / "rewrite_probe.csv"
+    path.write_text("a\n1\n")
+    mtime_ns = path.stat().st_mtime_ns
+    assert app_module._read_results_csv(path.name) == (["a"], [("1",)])
+    path.write_text("a\n22\n")
+    os.utime(path, ns=(mtime_ns, mtime_ns))  # same tick on a coarse filesystem
+    assert app_module._read_results_csv(path.name) == (["a"], [("22",)])
+
+
 # ── /api/results/pdf ─────────────────────────────────────────────────────────────
 
 def test_api_results_pdf_requires_jwt(client):
@@ -233,15 +403,39 @@ def test_api_results_pdf_requires_jwt(client):
     assert rv.status_code == 401
 
 
-def test_api_results_pdf_after_validate(client, auth_headers):
+def test_api_results_pdf_after_validate(client, auth_headers, validated_results):
+    rv = client.get("/api/results/pdf", headers=auth_headers)
+    assert rv.status_code == 200
+    assert rv.content_type == "application/pdf"
+
+
+def test_api_results_pdf_is_cached_until_revalidated(client, auth_headers, monkeypatch):
+    from server import app as app_module
     client.post(
         "/api/validate",
         json={"n_records": 2, "synthetic": True},
         headers=auth_headers,
     )
-    rv = client.get("/api/results/pdf", headers=auth_headers)
-    assert rv.status_code == 200
-    assert rv.content_type == "application/pdf"
+    calls = []
+    build = app_module._build_pdf
+
+    def counting_build(*args):
+        calls.append(args)
+        return build(*args)
+
+    monkeypatch.setattr(app_module, "_build_pdf", counting_build)
+    first = client.get("/api/results/pdf", headers=auth_headers)
+    second = client.get("/api/results/pdf", headers=auth_headers)
+    assert first.data == second.data
+    assert len(calls) == 1
+
+    client.post(
+        "/api/validate",
+        json={"n_records": 2, "synthetic": True},
+        headers=auth_headers,
+    )
+    client.get("/api/results/pdf", headers=auth_headers)
+    assert len(calls) == 2
 
 
 # ── /api/results/docx ────────────────────────────────────────────────────────────
@@ -251,12 +445,7 @@ def test_api_results_docx_requires_jwt(client):
     assert rv.status_code == 401
 
 
-def test_api_results_docx_after_validate(client, auth_headers):
-    client.post(
-        "/api/validate",
-        json={"n_records": 2, "synthetic": True},
-        headers=auth_headers,
-    )
+def test_api_results_docx_after_validate(client, auth_headers, validated_results):
     rv = client.get("/api/results/docx", headers=auth_headers)
     assert rv.status_code == 200
     assert "wordprocessingml" in rv.content_type
@@ -280,17 +469,71 @@ def test_api_send_results_invalid_email(client, auth_headers):
     assert rv.status_code == 400
 
 
+def test_api_send_results_reuses_smtp_connection(client, auth_headers, validated_results, monkeypatch):
+    from server import app as app_module
+
+    class FakeSMTP:
+        instances = []
+
+        def __init__(self, *args, **kwargs):
+            self.sent = []
+            FakeSMTP.instances.append(self)
+
+        def ehlo(self):
+            pass
+
+        def starttls(self):
+            pass
+
+        def send_message(self, msg):
+            self.sent.append((msg["To"], msg.as_string()))
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(app_module.smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(app_module, "_smtp_conn", None)
+    for addr in ("a@example.com", "b@example.com"):
+        rv = client.post("/api/send-results", json={"email": addr}, headers=auth_headers)
+        assert rv.status_code == 200
+    assert len(FakeSMTP.instances) == 1
+    sent = FakeSMTP.instances[0].sent
+    assert [to for to, _ in sent] == ["a@example.com", "b@example.com"]
+    assert 'filename="results.pdf"' in sent[1][1]
+
+
+
+def test_email_csvs_come_from_the_report_snapshot(validated_results, results_dir):
+    from server import app as app_module
+
+    def encoded_csvs(metrics, summary):
+        with app_module._mime_cache_lock:
+            app_module._mime_cache.clear()
+        parts = app_module._encoded_attachments(("probe",), metrics, summary)
+        return {
+            p.get_filename(): p.get_payload(decode=True)
+            for p in parts if p.get_content_type() == "text/csv"
+        }
+
+    metrics = app_module._read_results_csv("metrics.csv")
+    summary = app_module._read_results_csv("summary.csv")
+    csvs = encoded_csvs(metrics, summary)
+    assert csvs["metrics.csv"] == (results_dir / "metrics.csv").read_bytes()
+    assert csvs["summary.csv"] == (results_dir / "summary.csv").read_bytes()
+
+    # The CSVs follow the tables the reports are built from, not the disk
+    csvs = encoded_csvs((metrics[0], metrics[1][:1]), summary)
+    assert csvs["metrics.csv"].count(b"\r\n") == 2
+
+
 # ── /api/metrics ─────────────────────────────────────────────────────────────────
 
 @pytest.fixture
-def clear_metrics():
+def clear_metrics(monkeypatch):
     """Ensure _last_metrics is empty for the duration of the test, then restore."""
     from server import app as app_module
-    saved = dict(app_module._last_metrics)
-    app_module._last_metrics.clear()
-    yield
-    app_module._last_metrics.clear()
-    app_module._last_metrics.update(saved)
+    # Rebind rather than clear(): the bound dict may be shared with _run_cache.
+    monkeypatch.setattr(app_module, "_last_metrics", {})
 
 
 def test_api_metrics_requires_jwt(client):
@@ -305,11 +548,91 @@ def test_api_metrics_empty_before_run(client, auth_headers, clear_metrics):
     assert rv.get_json() == {}
 
 
-def test_api_metrics_populated_after_run(client, auth_headers):
+def _wait_for_run(client, headers, job_id, timeout_s=30.0):
+    """Poll GET /api/run/<job_id> until the job leaves the pending state."""
+    deadline = time.time() + timeout_s
+    while True:
+        rv = client.get(f"/api/run/{job_id}", headers=headers)
+        if rv.status_code != 202 or time.time() > deadline:
+            return rv
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def clear_run_cache():
+    from server import app as app_module
+    app_module._run_cache.clear()
+    yield
+    app_module._run_cache.clear()
+
+
+def test_api_run_returns_job_id(client, auth_headers, clear_run_cache):
+    rv = client.post("/api/run", json={"duration_s": 10}, headers=auth_headers)
+    assert rv.status_code == 202
+    job_id = rv.get_json()["job_id"]
+    done = _wait_for_run(client, auth_headers, job_id)
+    assert done.status_code == 200
+    assert done.get_json()["status"] == "ok"
+
+
+def test_api_run_repeat_is_served_from_cache(client, auth_headers, clear_run_cache):
+    first = client.post("/api/run", json={"duration_s": 10}, headers=auth_headers)
+    done = _wait_for_run(client, auth_headers, first.get_json()["job_id"])
+    rv = client.post("/api/run", json={"duration_s": 10}, headers=auth_headers)
+    assert rv.status_code == 200
+    data = rv.get_json()
+    assert data["cached"] is True
+    assert data["metrics"] == done.get_json()["metrics"]
+
+
+def test_api_run_never_evicts_unfinished_jobs(client, auth_headers, clear_run_cache, monkeypatch):
+    from concurrent.futures import Future
+    from server import app as app_module
+    running = Future()
+    finished = Future()
+    finished.set_result({})
+    jobs = app_module.OrderedDict(
+        [("running", running)]
+        + [(f"done{i}", finished) for i in range(app_module._RUN_JOBS_MAX - 1)]
+    )
+    monkeypatch.setattr(app_module, "_run_jobs", jobs)
+    rv = client.post("/api/run", json={"duration_s": 10}, headers=auth_headers)
+    assert rv.status_code == 202
+    assert "running" in jobs
+    assert "done0" not in jobs
+    assert len(jobs) == app_module._RUN_JOBS_MAX
+    _wait_for_run(client, auth_headers, rv.get_json()["job_id"])
+
+
+def test_api_config_post_clears_run_cache(client, auth_headers, clear_run_cache, restore_config):
+    from server import app as app_module
+    app_module._run_cache[("probe",)] = (time.time() + 60, {})
+    client.post("/api/config", json={"alpha": 2.0}, headers=auth_headers)
+    assert app_module._run_cache == {}
+
+
+def test_api_run_status_requires_jwt(client):
+    rv = client.get("/api/run/0123456789abcdef")
+    assert rv.status_code == 401
+
+
+def test_api_run_status_unknown_job(client, auth_headers):
+    rv = client.get("/api/run/0123456789abcdef", headers=auth_headers)
+    assert rv.status_code == 404
+
+
+def test_api_run_invalid_duration(client, auth_headers):
+    rv = client.post("/api/run", json={"duration_s": "long"}, headers=auth_headers)
+    assert rv.status_code == 400
+
+
+def test_api_metrics_populated_after_run(client, auth_headers, clear_run_cache):
     """After a successful /api/run the metrics endpoint returns the same data."""
     run_rv = client.post("/api/run", json={"duration_s": 10}, headers=auth_headers)
-    assert run_rv.status_code == 200
-    run_metrics = run_rv.get_json()["metrics"]
+    assert run_rv.status_code == 202
+    done_rv = _wait_for_run(client, auth_headers, run_rv.get_json()["job_id"])
+    assert done_rv.status_code == 200
+    run_metrics = done_rv.get_json()["metrics"]
 
     metrics_rv = client.get("/api/metrics", headers=auth_headers)
     assert metrics_rv.status_code == 200
@@ -0,0 +1,174 @@
+"""
+Tests for the results and cache files written by the validation package.
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# Ensure the repo root is on the path so validation/ is importable
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from validation import multi_record_validation, physionet_loader  # noqa: E402
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(multi_record_validation, "RESULTS_DIR", tmp_path)
+    monkeypatch.setattr(multi_record_validation, "CACHE_DIR", tmp_path / "cache")
+    return tmp_path
+
+
+# ── results/metrics.csv and results/summary.csv ─────────────────────────────────
+
+def test_results_csvs_written_after_every_record(results_dir):
+    multi_record_validation.run_multi_record_validation(n_records=2, use_synthetic=True)
+    metrics = (results_dir / "metrics.csv").read_text().splitlines()
+    assert metrics[0].startswith("record_id,")
+    assert len(metrics) == 3
+    assert (results_dir / "summary.csv").is_file()
+    assert sorted(p.name for p in results_dir.iterdir()) == ["metrics.csv", "summary.csv"]
+
+
+def test_failed_run_keeps_previous_results(results_dir, monkeypatch):
+    (results_dir / "metrics.csv").write_text("previous metrics\n")
+    (results_dir / "summary.csv").write_text("previous summary\n")
+    process = multi_record_validation._process_record
+
+    def failing_process(record_id, *args):
+        if record_id == 2:
+            raise RuntimeError("record 2 failed")
+        return process(record_id, *args)
+
+    monkeypatch.setattr(multi_record_validation, "_process_record", failing_process)
+    with pytest.raises(RuntimeError):
+        multi_record_validation.run_multi_record_validation(n_records=3, use_synthetic=True)
+    assert (results_dir / "metrics.csv").read_text() == "previous metrics\n"
+    assert (results_dir / "summary.csv").read_text() == "previous summary\n"
+    assert sorted(p.name for p in results_dir.iterdir()) == ["metrics.csv", "summary.csv"]
+
+
+# ── Per-record result cache (multi_record_validation) ───────────────────────────
+
+@pytest.fixture
+def pipeline_runs(monkeypatch):
+    """Count run_pipeline calls made while processing records."""
+    calls = []
+    run_pipeline = multi_record_validation.run_pipeline
+
+    def counting_run_pipeline(*args, **kwargs):
+        calls.append(1)
+        return run_pipeline(*args, **kwargs)
+
+    monkeypatch.setattr(multi_record_validation, "run_pipeline", counting_run_pipeline)
+    return calls
+
+
+def test_record_cache_skips_pipeline_on_rerun(results_dir, pipeline_runs):
+    first = multi_record_validation.run_multi_record_validation(
+        n_records=2, use_synthetic=True, use_cache=True,
+    )
+    assert len(pipeline_runs) > 0
+    assert len(list((results_dir / "cache").glob("*.json"))) == 2
+    pipeline_runs.clear()
+    second = multi_record_validation.run_multi_record_validation(
+        n_records=2, use_synthetic=True, use_cache=True,
+    )
+    assert pipeline_runs == []
+    assert second["stats"] == first["stats"]
+
+
+def test_record_cache_version_bump_misses(results_dir, pipeline_runs, monkeypatch):
+    multi_record_validation.run_multi_record_validation(
+        n_records=2, use_synthetic=True, use_cache=True,
+    )
+    monkeypatch.setattr(
+        multi_record_validation, "CACHE_VERSION", multi_record_validation.CACHE_VERSION + 1,
+    )
+    pipeline_runs.clear()
+    multi_record_validation.run_multi_record_validation(
+        n_records=2, use_synthetic=True, use_cache=True,
+    )
+    assert len(pipeline_runs) > 0
+    assert len(list((results_dir / "cache").glob("*.json"))) == 4
+
+
+def test_record_cache_skips_synthetic_fallback(results_dir, monkeypatch):
+    def unavailable(record_id):
+        raise ImportError("wfdb package required")
+
+    monkeypatch.setattr(multi_record_validation, "load_bidmc_record", unavailable)
+    multi_record_validation.run_multi_record_validation(
+        n_records=2, use_synthetic=False, use_cache=True,
+    )
+    assert list((results_dir / "cache").iterdir()) == []
+
+# ── BIDMC record cache (physionet_loader) ───────────────────────────────────────
+
+@pytest.fixture
+def stub_wfdb(tmp_path, monkeypatch):
+    """Point BIDMC_CACHE_DIR at tmp_path and count stubbed PhysioNet downloads."""
+    downloads = []
+
+    def rdrecord(record_name, pn_dir):
+        downloads.append(record_name)
+        t = np.arange(60 * 125) / 125
+        resp = np.sin(2 * np.pi * 0.25 * t)
+        resp[10] = np.nan
+        return SimpleNamespace(
+            sig_name=["II", "RESP"],
+            p_signal=np.column_stack([np.zeros_like(resp), resp]),
+            fs=125,
+        )
+
+    monkeypatch.setattr(physionet_loader, "BIDMC_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(physionet_loader, "_WFDB_AVAILABLE", True)
+    monkeypatch.setattr(
+        physionet_loader, "wfdb", SimpleNamespace(rdrecord=rdrecord), raising=False,
+    )
+    return downloads
+
+
+def test_bidmc_cache_miss_then_hit(stub_wfdb, tmp_path):
+    first = physionet_loader.load_bidmc_record(3)
+    assert stub_wfdb == ["bidmc03"]
+    assert [p.name for p in tmp_path.iterdir()] == [
+        f"bidmc03_50hz_v{physionet_loader.BIDMC_CACHE_VERSION}.npz"
+    ]
+    second = physionet_loader.load_bidmc_record(3)
+    assert stub_wfdb == ["bidmc03"]
+    assert np.array_equal(first["signal"], second["signal"])
+    assert np.isfinite(second["signal"]).all()
+    assert second["fs"] == 50
+    assert second["record"] == "bidmc03"
+
+
+def test_bidmc_cache_version_bump_misses(stub_wfdb, monkeypatch):
+    physionet_loader.load_bidmc_record(3)
+    monkeypatch.setattr(
+        physionet_loader, "BIDMC_CACHE_VERSION", physionet_loader.BIDMC_CACHE_VERSION + 1,
+    )
+    physionet_loader.load_bidmc_record(3)
+    assert stub_wfdb == ["bidmc03", "bidmc03"]
+
+
+def test_bidmc_cache_corrupt_entry_is_replaced(stub_wfdb, tmp_path):
+    path = tmp_path / f"bidmc03_50hz_v{physionet_loader.BIDMC_CACHE_VERSION}.npz"
+    path.write_bytes(b"not an npz file")
+    record = physionet_loader.load_bidmc_record(3)
+    assert stub_wfdb == ["bidmc03"]
+    with np.load(path) as cached:
+        assert np.array_equal(cached["signal"], record["signal"])
+
+
+def test_bidmc_cache_failed_write_leaves_no_temp_file(stub_wfdb, tmp_path, monkeypatch):
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(physionet_loader.os, "replace", failing_replace)
+    record = physionet_loader.load_bidmc_record(3)
+    assert len(record["signal"]) == 60 * 50
+    assert list(tmp_path.iterdir()) == []
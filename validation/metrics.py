@@ -9,9 +9,13 @@ Implements the primary outcomes from PAPER.md §5.3:
   - FFT peak shift      — dominant spectral frequency baseline (PAPER.md §5.2)
 """
 
+from functools import lru_cache
+
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.fft import rfft, rfftfreq
 from scipy.ndimage import uniform_filter1d
-from scipy.signal import welch
+from scipy.signal import get_window
 
 
 def detection_latency(
@@ -34,11 +38,14 @@ def detection_latency(
     -------
     Latency in seconds.  Returns np.inf if no alarm fires after onset.
     """
-    tail = delta_phi[onset_sample:]
-    alarm_indices = np.where(tail > threshold)[0]
-    if alarm_indices.size == 0:
+    alarms = delta_phi[onset_sample:] > threshold
+    if alarms.size == 0:
+        return np.inf
+    # argmax stops at the first True (0 if there is none); no index array.
+    first = int(alarms.argmax())
+    if not alarms[first]:
         return np.inf
-    return float(alarm_indices[0]) / fs
+    return float(first) / fs
 
 
 def false_alarm_rate(
@@ -63,8 +70,8 @@ def false_alarm_rate(
     False alarms per minute.
     """
     above = delta_phi > threshold
-    transitions = np.diff(above.astype(np.int8))
-    n_alarms = int(np.sum(transitions == 1))
+    # Rising edges: above now, not above at the previous sample.
+    n_alarms = int(np.count_nonzero(above[1:] & ~above[:-1]))
     duration_min = len(delta_phi) / fs / 60.0
     if duration_min < 1e-9:
         return 0.0
@@ -84,8 +91,20 @@ def rms_envelope(signal: np.ndarray, window_samples: int = 150) -> np.ndarray:
     -------
     RMS envelope array with the same length as signal.
     """
-    mean_sq = uniform_filter1d(signal ** 2, size=window_samples, mode='nearest')
-    return np.sqrt(np.maximum(mean_sq, 0.0))
+    # Two allocations (squares, filter output); clamp and sqrt run in place.
+    sq = np.square(signal, dtype=np.float64)
+    out = np.empty_like(sq)
+    uniform_filter1d(sq, size=window_samples, mode='nearest', output=out)
+    np.maximum(out, 0.0, out=out)
+    return np.sqrt(out, out=out)
+
+
+@lru_cache(maxsize=8)
+def _hann(n: int) -> np.ndarray:
+    """Periodic Hann window of length n (as used by welch), shared read-only."""
+    win = get_window('hann', n)
+    win.flags.writeable = False
+    return win
 
 
 def fft_peak_shift(
@@ -100,7 +119,10 @@ def fft_peak_shift(
     Track the dominant spectral peak in the respiratory band (PAPER.md §5.2).
 
     Uses overlapping Welch-style windows to estimate the instantaneous
-    respiratory frequency over time.
+    respiratory frequency over time.  All windows are transformed in one
+    batched FFT; each window's periodogram matches
+    ``scipy.signal.welch(seg, fs=fs, nperseg=window_samples)`` (Hann window,
+    constant detrend, one-sided density).
 
     Parameters
     ----------
@@ -115,18 +137,34 @@ def fft_peak_shift(
     times      : np.ndarray – center time of each window (s)
     peak_freqs : np.ndarray – dominant frequency in [lo, hi] Hz
     """
-    times, peak_freqs = [], []
-    half = window_samples // 2
-    for start in range(0, len(signal) - window_samples + 1, step_samples):
-        seg = signal[start:start + window_samples]
-        freqs_w, psd = welch(seg, fs=fs, nperseg=len(seg))
-        mask = (freqs_w >= lo) & (freqs_w <= hi)
-        if mask.any():
-            peak_freqs.append(freqs_w[mask][np.argmax(psd[mask])])
-        else:
-            peak_freqs.append(float('nan'))
-        times.append((start + half) / fs)
-    return np.array(times), np.array(peak_freqs)
+    signal = np.asarray(signal, dtype=np.float64)
+    if len(signal) < window_samples:
+        return np.array([]), np.array([])
+
+    # (n_windows, window_samples) strided view — no copy until detrending.
+    segs = sliding_window_view(signal, window_samples)[::step_samples]
+    starts = np.arange(segs.shape[0]) * step_samples
+    times = (starts + window_samples // 2) / fs
+
+    freqs = rfftfreq(window_samples, d=1.0 / fs)
+    mask = (freqs >= lo) & (freqs <= hi)
+    if not mask.any():
+        return times, np.full(segs.shape[0], np.nan)
+
+    segs = segs - segs.mean(axis=1, keepdims=True)
+    segs *= _hann(window_samples)
+    spec = rfft(segs, axis=1)
+    psd = spec.real ** 2 + spec.imag ** 2  # |X|² without the sqrt in abs()
+    # One-sided spectrum: every bin except DC (and Nyquist for even lengths)
+    # carries the power of its negative-frequency twin, as in welch().
+    if window_samples % 2:
+        psd[:, 1:] *= 2
+    else:
+        psd[:, 1:-1] *= 2
+
+    band = np.flatnonzero(mask)
+    peak_freqs = freqs[band][np.argmax(psd[:, band], axis=1)]
+    return times, peak_freqs
 
 
 def compute_all_metrics(
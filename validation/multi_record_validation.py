@@ -27,22 +27,32 @@ Dataset:  https://physionet.org/content/bidmc/1.0.0/
 """
 
 import csv
-import sys
+import hashlib
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
-from scipy.signal import resample
+from scipy.signal import resample_poly
 
-# Allow importing from the repo root
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from validation.physionet_loader import load_bidmc_record, generate_synthetic_resp  # noqa: E402
-from validation.pipeline import (  # noqa: E402
+from validation.physionet_loader import (
+    BIDMC_CACHE_VERSION,
+    BIDMC_DIR,
+    load_bidmc_record,
+    generate_synthetic_resp,
+)
+from validation.pipeline import (
     run_pipeline,
+    DEFAULT_ALPHA,
     DEFAULT_BASELINE_SAMP,
+    DEFAULT_HI_HZ,
+    DEFAULT_LO_HZ,
     DEFAULT_MEMORY_SAMPLES,
 )
-from validation.metrics import (  # noqa: E402
+from validation.metrics import (
     detection_latency,
     rms_envelope,
     fft_peak_shift,
@@ -51,9 +61,17 @@ from validation.metrics import (  # noqa: E402
 # Minimum signal duration for the three regimes (seconds)
 _MIN_DURATION_S = 90
 
+# Perturbation onset within each analysed segment (seconds)
+_ONSET_S = 30.0
+
 # Output directory (repo root / results)
 RESULTS_DIR = Path(__file__).parent.parent / "results"
 
+# Opt-in per-record result cache.  Bump CACHE_VERSION whenever a change to the
+# pipeline or the perturbation protocol alters the per-record metrics.
+CACHE_VERSION = 1
+CACHE_DIR = RESULTS_DIR / "cache"
+
 
 # ── Semi-synthetic perturbations (identical to validate_bidmc.py) ──────────────
 
@@ -66,9 +84,13 @@ def _apply_drift(signal: np.ndarray, fs: float, onset_s: float) -> np.ndarray:
     morphology in the stable portion while introducing a controlled perturbation.
     """
     onset = int(onset_s * fs)
-    stable_part = signal[:onset].copy()
+    stable_part = signal[:onset]
     tail = signal[onset:]
-    tail_fast = resample(tail, int(len(tail) * 1.6))[:len(tail)]
+    # Resample tail by 8/5 (1.6×) with a polyphase FIR.  Only the first
+    # len(tail) output samples are kept, so feed just the 5/8 of the tail
+    # they come from plus a margin covering the filter's half-length.
+    n_in = -(-len(tail) * 5 // 8) + 64
+    tail_fast = resample_poly(tail[:n_in], 8, 5)[:len(tail)]
     return np.concatenate([stable_part, tail_fast])
 
 
@@ -124,10 +146,7 @@ def _rms_detection_latency(
         baseline_std = 1e-9
     threshold = alpha * baseline_std
     tail = np.abs(rms[onset_sample:] - baseline_mean)
-    above = np.where(tail > threshold)[0]
-    if above.size == 0:
-        return np.inf
-    return float(above[0]) / fs
+    return detection_latency(tail, threshold, 0, fs)
 
 
 def _fft_detection_latency(
@@ -157,27 +176,55 @@ def _fft_detection_latency(
     """
     times, peak_freqs = fft_peak_shift(signal, fs)
     onset_time = onset_sample / fs
-    stable_mask = times < onset_time
-    if stable_mask.sum() < 2:
+    # times is ascending, so stable / post-onset windows split at one index
+    split = int(np.searchsorted(times, onset_time))
+    if split < 2:
         return np.inf
-    stable_freqs = peak_freqs[stable_mask]
+    stable_freqs = peak_freqs[:split]
     baseline_mean = float(np.nanmean(stable_freqs))
     baseline_std = float(np.nanstd(stable_freqs))
     if baseline_std < 1e-9:
         baseline_std = 1e-9
     threshold = alpha * baseline_std
-    post_mask = times >= onset_time
-    post_freqs = peak_freqs[post_mask]
-    post_times = times[post_mask]
-    above = np.where(np.abs(post_freqs - baseline_mean) > threshold)[0]
+    above = np.abs(peak_freqs[split:] - baseline_mean) > threshold
     if above.size == 0:
         return np.inf
-    return float(post_times[above[0]] - onset_time)
+    first = int(above.argmax())  # first alarm window (0 if none)
+    if not above[first]:
+        return np.inf
+    return float(times[split + first] - onset_time)
 
 
 # ── Single-record processing ───────────────────────────────────────────────────
 
-def _process_record(record_id: int, use_synthetic: bool = False) -> dict:
+def _record_cache_path(record_id: int, use_synthetic: bool) -> Path:
+    """
+    Cache file for one record's metrics, keyed on every input that shapes them.
+
+    The data itself is not hashed: that would require the download the cache
+    exists to avoid.  The BIDMC release is versioned (BIDMC_DIR), and the
+    loader's cleaning and resampling by BIDMC_CACHE_VERSION.
+    """
+    key = json.dumps(dict(
+        version=CACHE_VERSION,
+        loader_version=BIDMC_CACHE_VERSION,
+        record_id=record_id,
+        source="synthetic" if use_synthetic else BIDMC_DIR,
+        min_duration_s=_MIN_DURATION_S,
+        onset_s=_ONSET_S,
+        band_hz=[DEFAULT_LO_HZ, DEFAULT_HI_HZ],
+        memory_samples=DEFAULT_MEMORY_SAMPLES,
+        baseline_samples=DEFAULT_BASELINE_SAMP,
+        alpha=DEFAULT_ALPHA,
+    ), sort_keys=True)
+    return CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()[:16]}.json"
+
+
+def _process_record(
+    record_id: int,
+    use_synthetic: bool = False,
+    use_cache: bool = False,
+) -> dict:
     """
     Process one BIDMC record (or synthetic fallback) and return per-record metrics.
 
@@ -185,6 +232,8 @@ def _process_record(record_id: int, use_synthetic: bool = False) -> dict:
     ----------
     record_id     : BIDMC record number 1–53
     use_synthetic : if True or if PhysioNet download fails, use synthetic signal
+    use_cache     : reuse / store the result under ``results/cache/``.  A BIDMC
+                    record that fell back to synthetic data is never stored.
 
     Returns
     -------
@@ -192,7 +241,12 @@ def _process_record(record_id: int, use_synthetic: bool = False) -> dict:
                     rms_latency, fft_latency
     (latency values are None when no alarm fires; false_alarms is an integer count)
     """
+    cache_path = _record_cache_path(record_id, use_synthetic) if use_cache else None
+    if cache_path is not None and cache_path.is_file():
+        return json.loads(cache_path.read_text())
+
     # 1. Load data
+    fell_back = False
     if use_synthetic:
         data = generate_synthetic_resp(duration_s=120, seed=record_id)
     else:
@@ -200,6 +254,7 @@ def _process_record(record_id: int, use_synthetic: bool = False) -> dict:
             data = load_bidmc_record(record_id)
         except Exception:
             data = generate_synthetic_resp(duration_s=120, seed=record_id)
+            fell_back = True
 
     signal, fs = data["signal"], float(data["fs"])
 
@@ -209,13 +264,16 @@ def _process_record(record_id: int, use_synthetic: bool = False) -> dict:
     # than 90 s, which are rare in BIDMC (all records are ≈ 8 min).
     min_n = int(_MIN_DURATION_S * fs)
     if len(signal) < min_n:
-        reps = int(np.ceil(min_n / len(signal)))
-        signal = np.tile(signal, reps)
+        # np.resize cycles the record up to exactly min_n samples
+        signal = np.resize(signal, min_n)
     signal = signal[:min_n]
 
-    onset_s = 30.0
+    onset_s = _ONSET_S
     n_stable = int(onset_s * fs)
     seg_len = n_stable * 2
+    # Only the first seg_len samples are ever analysed, so the perturbation
+    # helpers need not process (and then discard) the rest of the record.
+    segment = signal[:seg_len]
 
     # 2. Stable segment — false alarm COUNT (PAPER.md §5.3)
     stable_sig = signal[:n_stable]
@@ -226,18 +284,17 @@ def _process_record(record_id: int, use_synthetic: bool = False) -> dict:
     dp_interior = result_stable["delta_phi"][DEFAULT_BASELINE_SAMP:-DEFAULT_MEMORY_SAMPLES]
     threshold_stable = result_stable["threshold"]
     above_stable = dp_interior > threshold_stable
-    transitions = np.diff(above_stable.astype(np.int8))
-    false_alarms = int(np.sum(transitions == 1))
+    false_alarms = int(np.count_nonzero(above_stable[1:] & ~above_stable[:-1]))
 
     # 3. Drift segment — phase-memory detection latency (PAPER.md §5.3)
-    drift_sig = _apply_drift(signal, fs, onset_s=onset_s)[:seg_len]
+    drift_sig = _apply_drift(segment, fs, onset_s=onset_s)
     result_drift = run_pipeline(drift_sig, fs=fs)
     drift_lat = detection_latency(
         result_drift["delta_phi"], result_drift["threshold"], n_stable, fs
     )
 
     # 4. Pause segment — phase-memory detection latency (PAPER.md §5.3)
-    pause_sig = _apply_pause(signal, fs, onset_s=onset_s)[:seg_len]
+    pause_sig = _apply_pause(segment, fs, onset_s=onset_s)
     result_pause = run_pipeline(pause_sig, fs=fs)
     pause_lat = detection_latency(
         result_pause["delta_phi"], result_pause["threshold"], n_stable, fs
@@ -249,7 +306,7 @@ def _process_record(record_id: int, use_synthetic: bool = False) -> dict:
     # 6. FFT baseline latency — computed on drift segment (PAPER.md §5.2)
     fft_lat = _fft_detection_latency(drift_sig, fs, n_stable, n_stable)
 
-    return dict(
+    row = dict(
         record_id=record_id,
         drift_latency=None if np.isinf(drift_lat) else round(drift_lat, 4),
         pause_latency=None if np.isinf(pause_lat) else round(pause_lat, 4),
@@ -257,6 +314,12 @@ def _process_record(record_id: int, use_synthetic: bool = False) -> dict:
         rms_latency=None if np.isinf(rms_lat) else round(rms_lat, 4),
         fft_latency=None if np.isinf(fft_lat) else round(fft_lat, 4),
     )
+    if cache_path is not None and not fell_back:
+        # Write-then-rename so a concurrent worker never reads a partial file
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(row))
+        os.replace(tmp_path, cache_path)
+    return row
 
 
 # ── Multi-record runner ────────────────────────────────────────────────────────
@@ -264,6 +327,8 @@ def _process_record(record_id: int, use_synthetic: bool = False) -> dict:
 def run_multi_record_validation(
     n_records: int = 5,
     use_synthetic: bool = False,
+    executor: Optional[Executor] = None,
+    use_cache: bool = False,
 ) -> dict:
     """
     Process N BIDMC records and compute quantitative metrics for PAPER.md §6.
@@ -282,6 +347,12 @@ def run_multi_record_validation(
     ----------
     n_records     : number of BIDMC records to evaluate (≥ 5)
     use_synthetic : use synthetic signal for all records (offline/CI mode)
+    executor      : optional ``concurrent.futures`` executor; records are
+                    independent, so with a ``ProcessPoolExecutor`` they are
+                    processed in parallel.  Rows keep record order.  Ignored
+                    for a single record, which gains nothing from the hop.
+    use_cache     : reuse per-record results from ``results/cache/`` (see
+                    CACHE_VERSION) instead of recomputing them
 
     Returns
     -------
@@ -291,44 +362,68 @@ def run_multi_record_validation(
       methods_statement – one-sentence Methods statement for the paper
     """
     RESULTS_DIR.mkdir(exist_ok=True)
+    if use_cache:
+        CACHE_DIR.mkdir(exist_ok=True)
 
-    rows = []
-    for rec_id in range(1, n_records + 1):
-        row = _process_record(rec_id, use_synthetic=use_synthetic)
-        rows.append(row)
+    record_ids = range(1, n_records + 1)
+    if executor is None or n_records < 2:
+        rows = (_process_record(rec_id, use_synthetic, use_cache) for rec_id in record_ids)
+    else:
+        rows = executor.map(
+            _process_record, record_ids, repeat(use_synthetic), repeat(use_cache),
+        )
 
     # ── Write per-record CSV ──────────────────────────────────────────────────
+    # Both CSVs are written to temporary files and only moved into place once
+    # every record has finished, so readers (the server's download and report
+    # routes) never see a half-written table, and an interrupted run leaves
+    # the previous results intact.  Only the numeric values needed for the
+    # summary are retained in memory.
     metrics_path = RESULTS_DIR / "metrics.csv"
+    summary_path = RESULTS_DIR / "summary.csv"
+    metrics_tmp = metrics_path.with_suffix(f".{os.getpid()}.tmp")
+    summary_tmp = summary_path.with_suffix(f".{os.getpid()}.tmp")
     fieldnames = [
         "record_id", "drift_latency", "pause_latency",
         "false_alarms", "rms_latency", "fft_latency",
     ]
-    with open(metrics_path, "w", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-    # ── Compute aggregated statistics ─────────────────────────────────────────
-    metric_keys = ["drift_latency", "pause_latency", "false_alarms", "rms_latency", "fft_latency"]
-    stats: dict = {}
-    for key in metric_keys:
-        values = [r[key] for r in rows if r[key] is not None]
-        if values:
-            arr = np.array(values, dtype=float)
-            stats[key] = {
-                "mean": round(float(np.mean(arr)), 4),
-                "std":  round(float(np.std(arr)),  4),
-            }
-        else:
-            stats[key] = {"mean": None, "std": None}
-
-    # ── Write summary CSV ─────────────────────────────────────────────────────
-    summary_path = RESULTS_DIR / "summary.csv"
-    with open(summary_path, "w", newline="") as fh:
-        writer = csv.DictWriter(fh, fieldnames=["metric", "mean", "std"])
-        writer.writeheader()
-        for key, s in stats.items():
-            writer.writerow({"metric": key, "mean": s["mean"], "std": s["std"]})
+    metric_keys = fieldnames[1:]
+    values_by_key: dict = {key: [] for key in metric_keys}
+    try:
+        with open(metrics_tmp, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=fieldnames)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+                for key in metric_keys:
+                    if row[key] is not None:
+                        values_by_key[key].append(row[key])
+
+        # ── Compute aggregated statistics ─────────────────────────────────────
+        stats: dict = {}
+        for key in metric_keys:
+            values = values_by_key[key]
+            if values:
+                arr = np.array(values, dtype=float)
+                stats[key] = {
+                    "mean": round(float(np.mean(arr)), 4),
+                    "std":  round(float(np.std(arr)),  4),
+                }
+            else:
+                stats[key] = {"mean": None, "std": None}
+
+        # ── Write summary CSV ─────────────────────────────────────────────────
+        with open(summary_tmp, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=["metric", "mean", "std"])
+            writer.writeheader()
+            for key, s in stats.items():
+                writer.writerow({"metric": key, "mean": s["mean"], "std": s["std"]})
+
+        os.replace(metrics_tmp, metrics_path)
+        os.replace(summary_tmp, summary_path)
+    finally:
+        metrics_tmp.unlink(missing_ok=True)
+        summary_tmp.unlink(missing_ok=True)
 
     methods_statement = (
         f"Results are averaged across N = {n_records} BIDMC recordings using "
@@ -358,13 +453,31 @@ def main() -> None:
         "--synthetic", action="store_true",
         help="Use synthetic fallback signal (no internet required)",
     )
+    parser.add_argument(
+        "--jobs", type=int, default=1, metavar="J",
+        help="Worker processes for per-record processing (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--cache", action="store_true",
+        help="Reuse per-record results from results/cache/ across reruns",
+    )
     args = parser.parse_args()
 
     print(f"Running multi-record validation over {args.n_records} records …")
-    result = run_multi_record_validation(
-        n_records=args.n_records,
-        use_synthetic=args.synthetic,
-    )
+    if args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            result = run_multi_record_validation(
+                n_records=args.n_records,
+                use_synthetic=args.synthetic,
+                executor=executor,
+                use_cache=args.cache,
+            )
+    else:
+        result = run_multi_record_validation(
+            n_records=args.n_records,
+            use_synthetic=args.synthetic,
+            use_cache=args.cache,
+        )
     print(f"\n{result['methods_statement']}\n")
     print(f"{'Metric':<18}  {'Mean':>10}  {'SD':>10}")
     print("-" * 44)
@@ -15,7 +15,11 @@ This module provides:
   generate_synthetic_resp() – offline fallback for CI / no-network environments
 """
 
+import os
+from contextlib import suppress
+from functools import lru_cache
 from math import gcd
+from pathlib import Path
 
 import numpy as np
 from scipy.signal import resample_poly
@@ -38,8 +42,21 @@ RESP_CHANNEL = 'RESP'
 # PhysioNet directory identifier for wfdb.rdrecord
 BIDMC_DIR = 'bidmc/1.0.0'
 
+# Local cache of loaded records (override with RESPIROSYNC_CACHE).  The BIDMC
+# release is immutable, but entries hold the signal *after* NaN interpolation
+# and resampling, so bump BIDMC_CACHE_VERSION whenever that processing (or the
+# file format) changes; older entries are then simply never read again.
+BIDMC_CACHE_VERSION = 1
+BIDMC_CACHE_DIR = Path(
+    os.environ.get('RESPIROSYNC_CACHE', Path.home() / '.cache' / 'respirosync')
+) / BIDMC_DIR
 
-def load_bidmc_record(record_id: int = 1, target_fs: int = TARGET_FS) -> dict:
+
+def load_bidmc_record(
+    record_id: int = 1,
+    target_fs: int = TARGET_FS,
+    use_cache: bool = True,
+) -> dict:
     """
     Load a single BIDMC record and return the respiratory signal.
 
@@ -49,6 +66,9 @@ def load_bidmc_record(record_id: int = 1, target_fs: int = TARGET_FS) -> dict:
         Record number 1–53.
     target_fs : int
         Target sample rate in Hz (default: 50 Hz per PAPER.md §2.2).
+    use_cache : bool
+        Reuse / store the resampled signal under BIDMC_CACHE_DIR so repeat
+        runs skip the PhysioNet download.
 
     Returns
     -------
@@ -60,9 +80,21 @@ def load_bidmc_record(record_id: int = 1, target_fs: int = TARGET_FS) -> dict:
 
     Raises
     ------
-    ImportError  if wfdb is not installed.
+    ImportError  if wfdb is not installed (and the record is not cached).
     ValueError   if no RESP channel is found in the record.
     """
+    record_name = f'bidmc{record_id:02d}'
+    cache_path = BIDMC_CACHE_DIR / f'{record_name}_{target_fs}hz_v{BIDMC_CACHE_VERSION}.npz'
+    if use_cache and cache_path.is_file():
+        try:
+            with np.load(cache_path) as cached:
+                signal = cached['signal']
+        except Exception:
+            pass                        # unreadable entry — download again
+        else:
+            time = np.arange(len(signal)) / target_fs
+            return dict(signal=signal, fs=target_fs, time=time, record=record_name)
+
     if not _WFDB_AVAILABLE:
         raise ImportError(
             "wfdb package required.  Install with:\n"
@@ -70,7 +102,6 @@ def load_bidmc_record(record_id: int = 1, target_fs: int = TARGET_FS) -> dict:
             "or run with --synthetic to use the offline fallback."
         )
 
-    record_name = f'bidmc{record_id:02d}'
     record = wfdb.rdrecord(record_name, pn_dir=BIDMC_DIR)
 
     # Locate the RESP channel (case-insensitive)
@@ -83,9 +114,10 @@ def load_bidmc_record(record_id: int = 1, target_fs: int = TARGET_FS) -> dict:
     resp_idx = sig_names_upper.index(RESP_CHANNEL)
     signal = record.p_signal[:, resp_idx].astype(np.float64)
 
-    # Replace NaN / Inf samples with linear interpolation
-    bad = ~np.isfinite(signal)
-    if bad.any():
+    # Replace NaN / Inf samples with linear interpolation.  Any non-finite
+    # sample makes the sum non-finite, so clean records skip the mask.
+    if not np.isfinite(signal.sum()):
+        bad = ~np.isfinite(signal)
         xp = np.where(~bad)[0]
         signal[bad] = np.interp(np.where(bad)[0], xp, signal[xp])
 
@@ -94,10 +126,25 @@ def load_bidmc_record(record_id: int = 1, target_fs: int = TARGET_FS) -> dict:
     if native_fs != target_fs:
         signal = _resample(signal, native_fs, target_fs)
 
+    if use_cache:
+        _store_cached(cache_path, signal)
+
     time = np.arange(len(signal)) / target_fs
     return dict(signal=signal, fs=target_fs, time=time, record=record_name)
 
 
+def _store_cached(path: Path, signal: np.ndarray) -> None:
+    """Write a cache entry atomically; a failed write only costs the cache."""
+    tmp_path = path.with_name(f'{path.stem}.{os.getpid()}.tmp.npz')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(tmp_path, signal=signal)
+        os.replace(tmp_path, path)
+    except OSError:
+        with suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+
+
 def _resample(signal: np.ndarray, src_fs: int, dst_fs: int) -> np.ndarray:
     """Rational-ratio resampling via scipy.signal.resample_poly."""
     g = gcd(src_fs, dst_fs)
@@ -127,6 +174,23 @@ def generate_synthetic_resp(
     rng = np.random.default_rng(seed)
     n = int(duration_s * fs)
     t = np.arange(n) / fs
+
+    # Add small Gaussian noise to the shared noise-free waveform (the sum is
+    # a new array, so the cached template is never modified)
+    signal = _synthetic_template(n, fs, base_freq) + noise_std * rng.standard_normal(n)
+
+    return dict(signal=signal, fs=fs, time=t, record='synthetic')
+
+
+@lru_cache(maxsize=8)
+def _synthetic_template(n: int, fs: int, base_freq: float) -> np.ndarray:
+    """
+    Noise-free four-regime waveform behind generate_synthetic_resp().
+
+    Depends only on length, rate and base frequency, so records that differ
+    only in their noise seed share one phase integration.  Returned
+    read-only because every caller shares the same array.
+    """
     seg = n // 4
 
     # Instantaneous frequency for each segment
@@ -143,7 +207,5 @@ def generate_synthetic_resp(
     # Apply pause: near-zero amplitude in segment 3
     signal[2*seg:3*seg] *= 0.04
 
-    # Add small Gaussian noise
-    signal += noise_std * rng.standard_normal(n)
-
-    return dict(signal=signal, fs=fs, time=t, record='synthetic')
+    signal.flags.writeable = False
+    return signal
@@ -16,14 +16,18 @@ Decision logic (Eq. 6):
 
 Note on Hilbert transform:
   The C++ core uses a derivative approximation of H[x] that is valid for
-  narrow-band signals.  This Python implementation uses scipy.signal.hilbert
-  (FFT-based) for accuracy on real physiological signals.  Both are correct
+  narrow-band signals.  This Python implementation uses the FFT-based
+  transform (identical to scipy.signal.hilbert, see _analytic_signal) for
+  accuracy on real physiological signals.  Both are correct
   implementations of Eq. 2; the approximation is used in the C++ solely for
   computational efficiency on embedded hardware.
 """
 
+from functools import lru_cache
+
 import numpy as np
-from scipy.signal import butter, sosfiltfilt, hilbert, detrend as sp_detrend
+from scipy import fft as sp_fft
+from scipy.signal import butter, sosfilt, sosfiltfilt, detrend as sp_detrend
 
 # ── Default operator parameters (PAPER.md §4.2 and §8) ────────────────────
 DEFAULT_FS             = 50     # sample rate (Hz), PAPER.md §2.2
@@ -40,13 +44,15 @@ def bandpass_filter(
     lo: float = DEFAULT_LO_HZ,
     hi: float = DEFAULT_HI_HZ,
     order: int = 2,
+    causal: bool = False,
 ) -> np.ndarray:
     """
     2nd-order Butterworth bandpass filter (PAPER.md §2.4).
 
     Isolates the respiratory band (0.1–0.5 Hz), removing drift and motion
     artefacts.  Uses zero-phase filtering (sosfiltfilt) for offline/batch use;
-    replace with a causal filter for real-time deployment.
+    ``causal=True`` runs a single forward pass (sosfilt), as a real-time
+    deployment would, at half the cost but with the filter's phase lag.
 
     Parameters
     ----------
@@ -54,12 +60,15 @@ def bandpass_filter(
     fs     : sample rate (Hz)
     lo, hi : passband edges (Hz)
     order  : Butterworth filter order
+    causal : forward-only filtering instead of zero-phase forward–backward
 
     Returns
     -------
     Bandpass-filtered signal of the same length.
     """
-    sos = butter(order, [lo, hi], btype='bandpass', fs=fs, output='sos')
+    sos = _butter_sos(order, lo, hi, fs)
+    if causal:
+        return sosfilt(sos, signal)
     return sosfiltfilt(sos, signal)
 
 
@@ -94,27 +103,47 @@ def phase_memory_operator(
     dt = 1.0 / fs
 
     # ── Step 1: Analytic signal z(t) = x(t) + i·H[x(t)]  (Eq. 2) ──────────
-    z = hilbert(filtered)
+    z = _analytic_signal(filtered)
 
     # ── Step 2: Instantaneous phase θ(t) = arg(z(t))  (§3.1) ───────────────
     theta = np.angle(z)
 
     # ── Step 3: Phase velocity ω(t) = dθ/dt with 2π-unwrap  (Eq. 3) ────────
-    theta_unwrapped = np.unwrap(theta)
-    omega = np.gradient(theta_unwrapped, dt)   # rad/s
+    # Same result as np.gradient(np.unwrap(θ), dt), computed from the phase
+    # steps directly: each Δθ is wrapped into [−π, π) (the C++ unwrapDelta()),
+    # interior samples take the central difference (Δθ[n−1] + Δθ[n]) / 2dt
+    # and the two ends the one-sided step.  The unwrapped phase itself is
+    # never materialised.
+    omega = np.empty_like(theta)
+    if len(theta) > 1:
+        d_theta = np.diff(theta)
+        jumps = np.abs(d_theta) >= np.pi
+        if jumps.any():
+            d_theta[jumps] = np.mod(d_theta[jumps] + np.pi, 2.0 * np.pi) - np.pi
+        np.add(d_theta[:-1], d_theta[1:], out=omega[1:-1])
+        omega[1:-1] /= 2.0 * dt
+        omega[0] = d_theta[0] / dt
+        omega[-1] = d_theta[-1] / dt              # rad/s
+    else:
+        omega[:] = 0.0
 
     # ── Step 4: Short-term phase memory ω̄(t)  (Eq. 4) ─────────────────────
     # Causal rolling mean over M samples — matches the C++ rolling buffer.
     omega_bar = _causal_rolling_mean(omega, M)
 
     # ── Step 5: Instability metric ΔΦ(t) = |ω(t) − ω̄(t)|  (Eq. 5) ────────
-    delta_phi = np.abs(omega - omega_bar)
+    # abs() is applied in place on the difference to avoid a second temporary.
+    delta_phi = omega - omega_bar
+    np.abs(delta_phi, out=delta_phi)
 
     # ── Baseline σ_ω estimation on the calibration window  (Eq. 6) ──────────
+    # Population variance as E[ω²] − E[ω]²; the floor keeps σ_ω ≥ 1e-6 as a
+    # guard against near-zero (matches C++) and absorbs rounding below zero.
     n_cal = min(baseline_samples, len(omega))
-    sigma_omega = float(np.std(omega[:n_cal]))
-    if sigma_omega < 1e-6:
-        sigma_omega = 1e-6       # guard against near-zero (matches C++)
+    cal = omega[:n_cal]
+    cal_mean = cal.mean()
+    cal_var = cal.dot(cal) / n_cal - cal_mean * cal_mean
+    sigma_omega = float(np.sqrt(max(cal_var, 1e-12)))
     threshold = alpha * sigma_omega
 
     instability = delta_phi > threshold
@@ -132,6 +161,7 @@ def phase_memory_operator(
 def run_pipeline(
     signal: np.ndarray,
     fs: float = DEFAULT_FS,
+    causal: bool = False,
     **kwargs,
 ) -> dict:
     """
@@ -143,6 +173,8 @@ def run_pipeline(
     ----------
     signal : raw respiratory signal (e.g., from physionet_loader)
     fs     : sample rate (Hz)
+    causal : use the causal bandpass (see bandpass_filter); the published
+             validation results use the default zero-phase filter
     **kwargs : forwarded to phase_memory_operator (M, alpha, baseline_samples)
 
     Returns
@@ -151,11 +183,12 @@ def run_pipeline(
         filtered : np.ndarray – bandpass-filtered signal
         time     : np.ndarray – time axis (s)
     """
-    # Drift removal (PAPER.md §2.4)
-    x = sp_detrend(signal.astype(np.float64))
+    # Drift removal (PAPER.md §2.4).  Inputs that are already contiguous
+    # float64 are passed through without a copy; detrend returns a new array.
+    x = sp_detrend(np.ascontiguousarray(signal, dtype=np.float64))
 
     # Bandpass filter (§2.4)
-    filtered = bandpass_filter(x, fs=fs)
+    filtered = bandpass_filter(x, fs=fs, causal=causal)
 
     # Phase–memory operator (§3–4)
     result = phase_memory_operator(filtered, fs=fs, **kwargs)
@@ -166,6 +199,35 @@ def run_pipeline(
 
 # ── Internal helpers ──────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=16)
+def _butter_sos(order: int, lo: float, hi: float, fs: float) -> np.ndarray:
+    """
+    Butterworth bandpass design as second-order sections, memoised.
+
+    The design depends only on its parameters, which are the same for every
+    record and segment, so it is computed once per combination.  The array
+    is shared between callers and must not be modified (it is left writable
+    only because sosfilt's Cython kernel rejects read-only buffers).
+    """
+    return butter(order, [lo, hi], btype='bandpass', fs=fs, output='sos')
+
+
+def _analytic_signal(x: np.ndarray) -> np.ndarray:
+    """
+    Analytic signal x + i·H[x] via FFT — same result as scipy.signal.hilbert.
+
+    The input is real, so only the non-negative half of the spectrum is
+    computed (rfft).  Negative frequencies of the analytic signal are zero,
+    positive ones are doubled and DC / Nyquist kept, exactly as in hilbert().
+    """
+    n = len(x)
+    spectrum = np.zeros(n, dtype=np.complex128)
+    half = sp_fft.rfft(x)
+    spectrum[:len(half)] = half
+    spectrum[1:(n + 1) // 2] *= 2
+    return sp_fft.ifft(spectrum, overwrite_x=True)
+
+
 def _causal_rolling_mean(x: np.ndarray, M: int) -> np.ndarray:
     """
     Causal rolling mean over M samples.
@@ -173,11 +235,13 @@ def _causal_rolling_mean(x: np.ndarray, M: int) -> np.ndarray:
     Matches the C++ rolling-buffer implementation exactly:
       out[n] = mean(x[max(0, n-M+1) … n])
     """
+    if M < 1:
+        raise ValueError(f"memory window M must be >= 1, got {M}")
     out = np.empty_like(x)
     cumsum = np.cumsum(x)
-    for n in range(len(x)):
-        if n < M:
-            out[n] = cumsum[n] / (n + 1)
-        else:
-            out[n] = (cumsum[n] - cumsum[n - M]) / M
+    # Warm-up (n < M): mean of everything seen so far.
+    k = min(M, len(x))
+    out[:k] = cumsum[:k] / np.arange(1, k + 1)
+    # Steady state: window sum as a difference of prefix sums.
+    out[M:] = (cumsum[M:] - cumsum[:-M]) / M
     return out
@@ -8,47 +8,56 @@ from the PhysioNet BIDMC dataset (or a synthetic fallback).
 Usage
 -----
     # Full validation with PhysioNet download (requires internet):
-    python validation/validate_bidmc.py
+    python -m validation.validate_bidmc
 
     # Offline / CI mode (no internet required):
-    python validation/validate_bidmc.py --synthetic
+    python -m validation.validate_bidmc --synthetic
 
     # Specific record (1–53):
-    python validation/validate_bidmc.py --record 5
+    python -m validation.validate_bidmc --record 5
+
+    # Run the three regimes in parallel worker processes:
+    python -m validation.validate_bidmc --synthetic --jobs 3
+
+    # Metrics only, no figures (e.g. CI):
+    python -m validation.validate_bidmc --synthetic --no-plots
 
 Scientific basis: PAPER.md §5 (Experimental Protocol)
 Dataset:  https://physionet.org/content/bidmc/1.0.0/
 """
 
 import argparse
-import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
-from scipy.signal import resample
-
-# Allow running from the repository root or from validation/
-sys.path.insert(0, str(Path(__file__).parent))
+from scipy.signal import resample_poly
 
-from physionet_loader import load_bidmc_record, generate_synthetic_resp
-from pipeline import run_pipeline, DEFAULT_BASELINE_SAMP, DEFAULT_MEMORY_SAMPLES
-from metrics import (
+from validation.physionet_loader import load_bidmc_record, generate_synthetic_resp
+from validation.pipeline import run_pipeline, DEFAULT_BASELINE_SAMP, DEFAULT_MEMORY_SAMPLES
+from validation.metrics import (
     compute_all_metrics,
     detection_latency,
     false_alarm_rate,
     rms_envelope,
     fft_peak_shift,
 )
-from plots import (
-    plot_stable_segment,
-    plot_drift_segment,
-    plot_pause_segment,
-    plot_comparison,
-)
+# validation.plots (and with it matplotlib) is imported only where a figure
+# is drawn, so --no-plots runs and process-pool workers never load it.
 
 # Minimum signal duration required for the three regimes (seconds)
 _MIN_DURATION_S = 90
 
+# Validation regimes in report order, with their progress labels
+_REGIMES = ('stable', 'drift', 'pause')
+_REGIME_LABELS = {
+    'stable': "[1/3] Stable segment (Regime 1 — control)",
+    'drift':  "[2/3] Frequency-drift segment (Regime 2)",
+    'pause':  "[3/3] Pause segment (Regime 3)",
+}
+
 
 def _apply_drift(signal: np.ndarray, fs: float, onset_s: float) -> np.ndarray:
     """
@@ -59,10 +68,13 @@ def _apply_drift(signal: np.ndarray, fs: float, onset_s: float) -> np.ndarray:
     morphology in the stable portion while introducing a controlled perturbation.
     """
     onset = int(onset_s * fs)
-    stable_part = signal[:onset].copy()
+    stable_part = signal[:onset]
     tail = signal[onset:]
-    # Resample tail to 1.6× samples → same duration but higher rate
-    tail_fast = resample(tail, int(len(tail) * 1.6))[:len(tail)]
+    # Resample tail to 1.6× (8/5) samples → same duration but higher rate.
+    # Only the first len(tail) outputs are kept, so feed just the 5/8 of the
+    # tail they come from plus a margin covering the FIR half-length.
+    n_in = -(-len(tail) * 5 // 8) + 64
+    tail_fast = resample_poly(tail[:n_in], 8, 5)[:len(tail)]
     return np.concatenate([stable_part, tail_fast])
 
 
@@ -85,10 +97,84 @@ def _apply_pause(
     return out
 
 
-def run_validation(use_synthetic: bool = False, record_id: int = 1) -> dict:
+def _run_regime(
+    regime: str,
+    sig: np.ndarray,
+    fs: float,
+    onset_s: float,
+    make_plots: bool = True,
+) -> dict:
+    """
+    Run one validation regime: pipeline, its Table 1 metric and its figure.
+
+    Top-level so it can run in a worker process; only the figure path and
+    scalars are returned, so no signal arrays travel back.
+
+    Returns
+    -------
+    dict with keys: figure (None when make_plots is False), metric
+    (false-alarm rate for 'stable', detection latency otherwise),
+    sigma_omega, threshold
+    """
+    result = run_pipeline(sig, fs=fs)
+    figure = None
+    if regime == 'stable':
+        if make_plots:
+            from validation.plots import plot_stable_segment
+            figure = plot_stable_segment(
+                result['time'],
+                result['filtered'],
+                result['delta_phi'],
+                result['threshold'],
+            )
+        metric = false_alarm_rate(
+            # Skip the baseline calibration window at the start and M samples at
+            # the end (boundary effects from the Hilbert transform).
+            # FAR is measured on the interior post-calibration steady-state portion.
+            result['delta_phi'][DEFAULT_BASELINE_SAMP:-DEFAULT_MEMORY_SAMPLES],
+            result['threshold'],
+            fs,
+        )
+    else:
+        if make_plots:
+            from validation.plots import plot_drift_segment, plot_pause_segment
+            plot = plot_drift_segment if regime == 'drift' else plot_pause_segment
+            figure = plot(
+                result['time'],
+                result['filtered'],
+                result['delta_phi'],
+                result['threshold'],
+                result['instability'],
+                onset_time=onset_s,
+            )
+        metric = detection_latency(
+            result['delta_phi'],
+            result['threshold'],
+            int(onset_s * fs),
+            fs,
+        )
+    return dict(
+        figure=figure,
+        metric=metric,
+        sigma_omega=result['sigma_omega'],
+        threshold=result['threshold'],
+    )
+
+
+def run_validation(
+    use_synthetic: bool = False,
+    record_id: int = 1,
+    executor: Optional[Executor] = None,
+    make_plots: bool = True,
+) -> dict:
     """
     Run the complete validation pipeline and print the PAPER.md Table 1 summary.
 
+    The three regimes are independent; pass a ``concurrent.futures``
+    executor (e.g. a ``ProcessPoolExecutor``) to run them in parallel.
+    ``make_plots=False`` skips figure rendering (and the comparison-plot
+    pipeline run) when only the metrics are needed, e.g. in CI.
+
     Returns a dict of computed metrics for programmatic use / testing.
     """
     print("=" * 62)
@@ -115,89 +201,67 @@ def run_validation(use_synthetic: bool = False, record_id: int = 1) -> dict:
     # Ensure minimum duration
     min_n = int(_MIN_DURATION_S * fs)
     if len(signal) < min_n:
-        reps = int(np.ceil(min_n / len(signal)))
-        signal = np.tile(signal, reps)
+        # np.resize cycles the record up to exactly min_n samples
+        signal = np.resize(signal, min_n)
     signal = signal[:min_n]
 
     onset_s  = 30.0                 # perturbation onset at 30 s
     n_stable = int(onset_s * fs)    # samples in the stable (control) segment
     seg_len  = n_stable * 2         # total samples per per-regime signal
-
-    # ── 2. Stable segment (Regime 1) ─────────────────────────────────────────
-    print("\n[1/3] Stable segment (Regime 1 — control) …")
-    stable_sig    = signal[:n_stable]
-    result_stable = run_pipeline(stable_sig, fs=fs)
-    fig1 = plot_stable_segment(
-        result_stable['time'],
-        result_stable['filtered'],
-        result_stable['delta_phi'],
-        result_stable['threshold'],
-    )
-    print(f"      → {fig1}")
-    far_stable = false_alarm_rate(
-        # Skip the baseline calibration window at the start and M samples at
-        # the end (boundary effects from the Hilbert transform).
-        # FAR is measured on the interior post-calibration steady-state portion.
-        result_stable['delta_phi'][DEFAULT_BASELINE_SAMP:-DEFAULT_MEMORY_SAMPLES],
-        result_stable['threshold'],
-        fs,
-    )
-
-    # ── 3. Drift segment (Regime 2) ──────────────────────────────────────────
-    print("\n[2/3] Frequency-drift segment (Regime 2) …")
-    drift_sig    = _apply_drift(signal, fs, onset_s=onset_s)[:seg_len]
-    result_drift = run_pipeline(drift_sig, fs=fs)
-    fig2 = plot_drift_segment(
-        result_drift['time'],
-        result_drift['filtered'],
-        result_drift['delta_phi'],
-        result_drift['threshold'],
-        result_drift['instability'],
-        onset_time=onset_s,
-    )
-    print(f"      → {fig2}")
-    lat_drift = detection_latency(
-        result_drift['delta_phi'],
-        result_drift['threshold'],
-        n_stable,
-        fs,
-    )
-
-    # ── 4. Pause segment (Regime 3) ──────────────────────────────────────────
-    print("\n[3/3] Pause segment (Regime 3) …")
-    pause_sig    = _apply_pause(signal, fs, onset_s=onset_s)[:seg_len]
-    result_pause = run_pipeline(pause_sig, fs=fs)
-    fig3 = plot_pause_segment(
-        result_pause['time'],
-        result_pause['filtered'],
-        result_pause['delta_phi'],
-        result_pause['threshold'],
-        result_pause['instability'],
-        onset_time=onset_s,
-    )
-    print(f"      → {fig3}")
-    lat_pause = detection_latency(
-        result_pause['delta_phi'],
-        result_pause['threshold'],
-        n_stable,
-        fs,
-    )
-
-    # ── 5. Baseline comparison plot ───────────────────────────────────────────
-    print("\n[4/4] Baseline comparison plot …")
-    full_result = run_pipeline(signal, fs=fs)
-    rms_env       = rms_envelope(full_result['filtered'])
-    fft_times, fft_freqs = fft_peak_shift(full_result['filtered'], fs)
-    fig4 = plot_comparison(
-        full_result['time'],
-        full_result['delta_phi'],
-        full_result['threshold'],
-        rms_env,
-        fft_times,
-        fft_freqs,
-        onset_time=onset_s,
-    )
-    print(f"      → {fig4}")
+    # Only the first seg_len samples reach the perturbed runs, so perturb
+    # that slice rather than the whole record.
+    segment  = signal[:seg_len]
+
+    # ── 2–4. Regimes 1–3 (stable, drift, pause) ─────────────────────────────
+    # The regimes are independent; with an executor they run in worker
+    # processes while the comparison plot below is drawn here.
+    regime_sigs = [
+        signal[:n_stable],                              # Regime 1 — control
+        _apply_drift(segment, fs, onset_s=onset_s),     # Regime 2
+        _apply_pause(segment, fs, onset_s=onset_s),     # Regime 3
+    ]
+    if executor is None:
+        regime_runs = map(
+            _run_regime, _REGIMES, regime_sigs, repeat(fs), repeat(onset_s),
+            repeat(make_plots),
+        )
+    else:
+        regime_runs = executor.map(
+            _run_regime, _REGIMES, regime_sigs, repeat(fs), repeat(onset_s),
+            repeat(make_plots),
+        )
+
+    # ── 5. Baseline comparison plot (figure only) ────────────────────────────
+    fig4 = None
+    if make_plots:
+        from validation.plots import plot_comparison
+        full_result = run_pipeline(signal, fs=fs)
+        rms_env       = rms_envelope(full_result['filtered'])
+        fft_times, fft_freqs = fft_peak_shift(full_result['filtered'], fs)
+        fig4 = plot_comparison(
+            full_result['time'],
+            full_result['delta_phi'],
+            full_result['threshold'],
+            rms_env,
+            fft_times,
+            fft_freqs,
+            onset_time=onset_s,
+        )
+
+    runs = {}
+    for regime, run in zip(_REGIMES, regime_runs):
+        print(f"\n{_REGIME_LABELS[regime]} …")
+        if run['figure'] is not None:
+            print(f"      → {run['figure']}")
+        runs[regime] = run
+    if fig4 is not None:
+        print("\n[4/4] Baseline comparison plot …")
+        print(f"      → {fig4}")
+
+    far_stable = runs['stable']['metric']
+    lat_drift  = runs['drift']['metric']
+    lat_pause  = runs['pause']['metric']
+    fig1       = runs['stable']['figure']
 
     # ── 6. PAPER.md Table 1 summary ──────────────────────────────────────────
     print()
@@ -217,18 +281,19 @@ def run_validation(use_synthetic: bool = False, record_id: int = 1) -> dict:
     else:
         print(f"{'Detection latency — pause (s)':<38} {lat_pause:>18.3f}")
     print(f"{'σ_ω  baseline std-dev (rad/s)':<38} "
-          f"{result_stable['sigma_omega']:>18.4f}")
+          f"{runs['stable']['sigma_omega']:>18.4f}")
     print(f"{'α·σ_ω  decision threshold (rad/s)':<38} "
-          f"{result_stable['threshold']:>18.4f}")
+          f"{runs['stable']['threshold']:>18.4f}")
     print("=" * 62)
-    print(f"\nFigures saved to: {Path(fig1).parent}")
+    if fig1 is not None:
+        print(f"\nFigures saved to: {Path(fig1).parent}")
 
     return dict(
         far_stable=far_stable,
         lat_drift=lat_drift,
         lat_pause=lat_pause,
-        sigma_omega=result_stable['sigma_omega'],
-        threshold=result_stable['threshold'],
+        sigma_omega=runs['stable']['sigma_omega'],
+        threshold=runs['stable']['threshold'],
     )
 
 
@@ -246,8 +311,29 @@ def main() -> None:
         '--record', type=int, default=1, metavar='N',
         help='BIDMC record number 1–53 (default: 1)',
     )
+    parser.add_argument(
+        '--jobs', type=int, default=1, metavar='J',
+        help='Worker processes for the three regimes (default: 1, serial)',
+    )
+    parser.add_argument(
+        '--no-plots', action='store_true',
+        help='Compute the Table 1 metrics only; skip rendering the figures',
+    )
     args = parser.parse_args()
-    run_validation(use_synthetic=args.synthetic, record_id=args.record)
+    if args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(_REGIMES))) as executor:
+            run_validation(
+                use_synthetic=args.synthetic,
+                record_id=args.record,
+                executor=executor,
+                make_plots=not args.no_plots,
+            )
+    else:
+        run_validation(
+            use_synthetic=args.synthetic,
+            record_id=args.record,
+            make_plots=not args.no_plots,
+        )
 
 
 if __name__ == '__main__':